@@ -1,37 +1,356 @@
+import io
+import os
+import json
+import hashlib
+
 import numpy as np
 
-# 1. CSV 파일 읽기 (dtype을 명시)
-#dtype=[(열, 타입),(열, 타입)] 
-dtype = [('parts', 'U20'), ('strength', 'f8')] #unicode는 문자열(한국어도 포함) 뒤에 숫자는 몇글자까지 가능한지./f는 float로 실수
-
-#genfromtxt는 txt파일을 배열로 바꾸는 함수(loadtxt와는 다르게 문자형/숫자형/빈칸 읽기 가능)
-#delimiter는 구분 기준, skip_header=1에서 1은 그 줄부터 읽으라는 뜻. 앞 스킵하고 지정한 줄 번호의 데이터부터 읽기
-#dtype=dtype: 열 이름과 자료형을 명확히 정의한 걸 genfromtxt에 전달
-arr1 = np.genfromtxt('mars_base_main_parts-001.csv', delimiter=',', skip_header=1, encoding='utf-8-sig', dtype=dtype) 
-arr2 = np.genfromtxt('mars_base_main_parts-002.csv', delimiter=',', skip_header=1, encoding='utf-8-sig', dtype=dtype)
-arr3 = np.genfromtxt('mars_base_main_parts-003.csv', delimiter=',', skip_header=1, encoding='utf-8-sig', dtype=dtype)
-
-# 2. 배열 합치기 (concatenate 사용)
-#구조화 배열은 사실상 dict와 같은 구조. vstack은 일반 2차원배열로 변환시키려 하며 열 이름을 무시하거나 axis기준이 잘못될 수 있음->concatenate가 더 적합함
-parts = np.concatenate((arr1, arr2, arr3))
-
-# 3. 부품별 평균값 계산
-#np.unique()는 중복없는 고유 이름만 추출
-#parts['parts']에서 앞의 parts는 위에서 합쳐놓은 전체 배열을 의미. 뒤의 대괄호 안의 'parts'는 맨위의 dtype에서 정의한 열 이름
-unique_parts = np.unique(parts['parts'])
-
-#평균이 낮은 재료들의 이름과 평균값을 각각 저장할 빈 리스트
-low_parts = []
-low_means = []
-
-#parts['parts']==part: 재료가 어떤 행에 있는지 표시하는 마스크를 만듦
-#parts['strength'][]: 위에서 만든 마스크가 True인 행만 선택
-for part in unique_parts:
-    strength_values = parts['strength'][parts['parts'] == part]
-    mean_strength = np.mean(strength_values)
-    if mean_strength < 50:
-        low_parts.append(part) #.append의 경우 그냥 맨 뒤에 하나씩 추가하는 것
-        low_means.append(mean_strength)
+# 1. CSV 파일 읽기
+#부품 이름은 같은 이름이 계속 반복됨 -> 이름을 매번 U20(80바이트)으로 저장하지 않고
+#이름 사전(vocab: 이름 -> 번호)에 한 번만 저장하고, 행마다 int32 번호(4바이트)만 저장 (범주형/사전 인코딩)
+coded_dtype = [('part_code', 'i4'), ('strength', 'f8')]
+NAME_LEN = 20 #기존 U20과 똑같이 20글자까지만 이름으로 사용 (결과 파일이 달라지지 않도록)
+
+#parts,strength 줄들을 한꺼번에 읽는 함수 (np.loadtxt: 줄 나누기/실수 변환을 C 파서가 처리)
+#comments=None: 부품 이름에 '#'이 있어도 주석으로 잘리지 않도록 / ndmin=1: 한 줄뿐이어도 1차원 배열
+#이름은 U20으로 읽으므로 기존처럼 20글자까지만 사용 / 값 형식이 틀리거나 열 개수가 다르면 ValueError
+parts_dtype = [('parts', f'U{NAME_LEN}'), ('strength', 'f8')]
+
+def parse_rows(lines):
+    rows = np.loadtxt(lines, dtype=parts_dtype, delimiter=',', comments=None, ndmin=1)
+    return rows['parts'], rows['strength']
+
+#이름들을 번호로 바꾸기. np.unique로 블록 안의 서로 다른 이름만 골라서 그것만 vocab에서 찾음
+#(줄마다가 아니라 부품 종류마다 한 번) 처음 보는 이름이면 vocab 맨 뒤에 새 번호로 추가
+#dict는 넣은 순서를 기억하므로 list(vocab)[번호] == 이름
+def encode_parts(names, vocab):
+    uniques, inverse = np.unique(names, return_inverse=True)
+    lookup = np.array([vocab.setdefault(name, len(vocab)) for name in uniques.tolist()], dtype='i4')
+    return lookup[inverse.reshape(-1)]
+
+#숫자가 이상한 줄이 섞여 있을 때: 한 줄씩 변환하고 못 읽는 값은 genfromtxt처럼 nan
+def to_float(value):
+    try:
+        return float(value)
+    except ValueError:
+        return np.nan
+
+# 스트리밍 읽기: 파일 전체를 메모리에 올리지 않고 CHUNK_BYTES씩 잘라 읽음
+#블록은 마지막 줄바꿈(\n)까지만 사용하고 잘린 줄은 다음 블록 앞에 붙임 (\n은 1바이트라 utf-8 글자가 중간에 잘리지 않음)
+CHUNK_BYTES = 1024 * 1024
+
+def iter_parts_chunks(file_path, vocab, chunk_bytes=CHUNK_BYTES):
+    with open(file_path, 'rb') as f:
+        rest = b''
+        first = True
+        while True:
+            block = f.read(chunk_bytes)
+            data = rest + block
+            if block: #마지막 블록이 아니면 마지막 줄바꿈 뒤는 다음으로 넘김
+                cut = data.rfind(b'\n') + 1
+                data, rest = data[:cut], data[cut:]
+            if not data:
+                if not block:
+                    break
+                continue
+
+            text = data.decode('utf-8-sig' if first else 'utf-8')
+            if first: #첫 블록의 첫 줄은 헤더
+                text = text.partition('\n')[2]
+                first = False
+            if not text.strip(): #빈 블록
+                if not block:
+                    break
+                continue
+
+            try:
+                names, strengths = parse_rows(io.StringIO(text))
+            except ValueError: #형식이 틀린 줄이 섞인 블록만 한 줄씩 처리 (못 읽는 값은 genfromtxt처럼 nan)
+                rows = [line.rpartition(',') for line in text.splitlines() if line.strip()]
+                names = np.array([row[0][:NAME_LEN] for row in rows], dtype=f'U{NAME_LEN}')
+                strengths = np.array([to_float(row[2]) for row in rows], dtype='f8')
+
+            chunk = np.empty(len(names), dtype=coded_dtype)
+            chunk['part_code'] = encode_parts(names, vocab)
+            chunk['strength'] = strengths
+            yield chunk
+
+            if not block:
+                break
+
+#파일별 요약(부품별 합계/개수/최소/최대/편차 제곱합 + 분포 히스토그램)을 저장해두는 캐시 파일
+#파일이 바뀌지 않았으면 CSV를 다시 읽지 않고 요약만 꺼내서 합침
+CACHE_FILE = 'parts_summary_cache.json'
+SUMMARY_VERSION = 3 #요약 형식이 바뀌면 올림 (예전 형식의 캐시는 다시 계산)
+#m2: 평균과의 차이 제곱합 (표준편차용. 합계/개수처럼 파일끼리 합칠 수 있음)
+summary_dtype = [('sum', 'f8'), ('count', 'i8'), ('min', 'f8'), ('max', 'f8'), ('m2', 'f8')]
+
+#분포 리포트(p5/p50/p95, 이상치)용 부품별 히스토그램: 칸 경계가 고정된 log-linear 구간
+#|값|을 2의 거듭제곱 구간 [2^(e-1), 2^e)으로 나누고 각 구간을 SUB_BINS칸으로 -> 칸 너비는 값의 1/SUB_BINS 이하
+#2^EXP_MIN 미만(0 포함)은 가운데 0 칸, 2^EXP_MAX 이상은 맨 끝 칸 / 음수는 0 칸 아래쪽에 대칭으로
+#부품 하나당 칸 수가 SKETCH_BINS개로 고정 -> 메모리/캐시 크기가 값의 종류 수나 파일 크기와 상관없음
+#칸 경계가 모든 파일에서 같아서 파일별 히스토그램은 칸끼리 더하기만 하면 합쳐짐
+SUB_BINS = 128
+EXP_MIN = -8 #약 0.004
+EXP_MAX = 24 #약 1677만
+MAG_BINS = (EXP_MAX - EXP_MIN) * SUB_BINS #양수(또는 음수) 쪽 칸 수
+ZERO_BIN = MAG_BINS
+SKETCH_BINS = 2 * MAG_BINS + 1
+MAX_MAGNITUDE = np.nextafter(2.0 ** EXP_MAX, 0) #이보다 큰 값(inf 포함)은 맨 끝 칸으로
+
+#칸 번호 -> 칸의 [아래 경계, 위 경계). 번호가 커질수록 값도 커지도록 배치
+_k = np.arange(MAG_BINS)
+_base = 2.0 ** (_k // SUB_BINS + EXP_MIN) #2^(e-1)
+_mag_low = _base * (1 + (_k % SUB_BINS) / SUB_BINS)
+_mag_high = _base * (1 + (_k % SUB_BINS + 1) / SUB_BINS)
+BIN_LOW = np.concatenate((-_mag_high[::-1], [0.0], _mag_low))
+BIN_HIGH = np.concatenate((-_mag_low[::-1], [0.0], _mag_high))
+
+#값 -> 칸 번호 (nan은 넣지 않음)
+def sketch_bins(values):
+    magnitude = np.minimum(np.abs(values), MAX_MAGNITUDE)
+    mantissa, exponent = np.frexp(magnitude) #magnitude = mantissa * 2^exponent, mantissa는 0.5 이상 1 미만
+    k = (exponent - EXP_MIN - 1) * SUB_BINS + ((2 * mantissa - 1) * SUB_BINS).astype('i8')
+    tiny = magnitude < 2.0 ** EXP_MIN
+    return np.where(tiny, ZERO_BIN, np.where(values < 0, ZERO_BIN - 1 - k, ZERO_BIN + 1 + k))
+
+#파일 내용이 같은지 확인하기 위한 해시 (큰 파일도 1MB씩 나눠서 읽음)
+def file_sha256(file_path):
+    h = hashlib.sha256()
+    with open(file_path, 'rb') as f:
+        for block in iter(lambda: f.read(1024 * 1024), b''):
+            h.update(block)
+    return h.hexdigest()
+
+#부품별 누적값(합계/개수/최소/최대/편차 제곱합)을 부품 번호로 인덱싱한 배열
+def new_accumulator(n_codes=0):
+    acc = np.zeros(n_codes, dtype=summary_dtype)
+    acc['min'] = np.inf
+    acc['max'] = -np.inf
+    return acc
+
+#부품별 편차 제곱합 합치기 (Chan 방식): 각 부분의 m2 + 부분 평균과 전체 평균 차이만큼 보정
+#codes: 부분마다 부품 번호, count/total/m2: 부분마다 개수/합계/편차 제곱합
+def merge_m2(codes, count, total, m2, n_codes):
+    all_count = np.bincount(codes, weights=count, minlength=n_codes)
+    all_sum = np.bincount(codes, weights=total, minlength=n_codes)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        all_mean = all_sum / all_count
+        part_mean = np.where(count > 0, total / np.maximum(count, 1), 0.0)
+        shift = np.where(count > 0, count * (part_mean - all_mean[codes]) ** 2, 0.0)
+    return np.bincount(codes, weights=m2 + shift, minlength=n_codes)
+
+#블록 하나를 누적값에 더하기. 새 부품이 생겨서 번호가 늘어나면 배열도 늘림
+#메모리는 블록 크기 + 부품 종류 수만큼만 사용 (파일 크기와 상관없음)
+def fold_chunk(acc, chunk, n_codes):
+    if len(acc) < n_codes:
+        grown = new_accumulator(n_codes)
+        grown[:len(acc)] = acc
+        acc = grown
+
+    codes = chunk['part_code']
+    strengths = chunk['strength']
+    count = np.bincount(codes, minlength=n_codes)
+    total = np.bincount(codes, weights=strengths, minlength=n_codes)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        chunk_mean = total / count
+    chunk_m2 = np.bincount(codes, weights=(strengths - chunk_mean[codes]) ** 2, minlength=n_codes)
+
+    #지금까지의 누적값과 이번 블록을 부분 두 개로 보고 합침
+    both = np.r_[np.arange(n_codes), np.arange(n_codes)]
+    acc['m2'] = merge_m2(both, np.r_[acc['count'], count], np.r_[acc['sum'], total], np.r_[acc['m2'], chunk_m2], n_codes)
+    acc['sum'] += total
+    acc['count'] += count
+    np.minimum.at(acc['min'], codes, strengths) #같은 번호끼리 최솟값
+    np.maximum.at(acc['max'], codes, strengths) #같은 번호끼리 최댓값
+    return acc
+
+#블록 하나를 부품별 히스토그램(부품 수 x SKETCH_BINS 배열)에 더하기 (nan은 분포에서 제외)
+def fold_sketch(sketch, chunk, n_codes):
+    if len(sketch) < n_codes:
+        grown = np.zeros((n_codes, SKETCH_BINS), dtype='i8')
+        grown[:len(sketch)] = sketch
+        sketch = grown
+
+    strengths = chunk['strength']
+    valid = ~np.isnan(strengths)
+    flat = chunk['part_code'][valid].astype('i8') * SKETCH_BINS + sketch_bins(strengths[valid]) #(부품, 칸) -> 한 줄 번호
+    sketch += np.bincount(flat, minlength=n_codes * SKETCH_BINS).reshape(n_codes, SKETCH_BINS)
+    return sketch
+
+#파일 하나를 블록 단위로 읽으며 누적 -> {이름: [합계, 개수, 최소, 최대, 편차 제곱합, [칸 번호들], [칸별 개수]]}
+#히스토그램은 값이 있는 칸만 저장 (json으로 저장 가능하도록, 부품당 최대 SKETCH_BINS개)
+def stream_summary(file_path, chunk_bytes=CHUNK_BYTES):
+    vocab = {}
+    acc = new_accumulator()
+    sketch = np.zeros((0, SKETCH_BINS), dtype='i8')
+    for chunk in iter_parts_chunks(file_path, vocab, chunk_bytes):
+        acc = fold_chunk(acc, chunk, len(vocab))
+        sketch = fold_sketch(sketch, chunk, len(vocab))
+
+    names = list(vocab)
+    summary = {}
+    for code, row in enumerate(acc):
+        if row['count']:
+            bins = np.flatnonzero(sketch[code])
+            summary[names[code]] = [float(row['sum']), int(row['count']), float(row['min']), float(row['max']),
+                                    float(row['m2']), bins.tolist(), sketch[code, bins].tolist()]
+    return summary
+
+def load_cache(cache_path=CACHE_FILE):
+    try:
+        with open(cache_path, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (FileNotFoundError, ValueError): #캐시가 없거나 깨져 있으면 처음부터 다시 계산
+        return {}
+
+def save_cache(cache, cache_path=CACHE_FILE):
+    try:
+        with open(cache_path, 'w', encoding='utf-8') as f:
+            json.dump(cache, f, ensure_ascii=False)
+    except OSError as e:
+        print('⚠️ 요약 캐시 저장 중 오류 발생:', e)
+
+#캐시 확인 순서: (수정시간, 크기)가 같으면 그대로 사용 -> 다르면 해시 비교 -> 내용이 바뀐 파일만 다시 계산
+#반환값: (요약, 다시 계산했는지 여부)
+def shard_summary(file_path, cache):
+    stat = os.stat(file_path)
+    entry = cache.get(file_path)
+    if entry and entry.get('version') != SUMMARY_VERSION:
+        entry = None
+    if entry and entry['mtime_ns'] == stat.st_mtime_ns and entry['size'] == stat.st_size:
+        return entry['parts'], False
+
+    digest = file_sha256(file_path)
+    if entry and entry['sha256'] == digest: #수정시간만 바뀌고 내용은 같은 경우 (복사, touch 등)
+        entry['mtime_ns'] = stat.st_mtime_ns
+        return entry['parts'], False
+
+    summary = stream_summary(file_path)
+    cache[file_path] = {'version': SUMMARY_VERSION, 'mtime_ns': stat.st_mtime_ns, 'size': stat.st_size, 'sha256': digest, 'parts': summary}
+    return summary, True
+
+#파일별 요약을 합치기: 합계/개수는 더하고, 최소/최대는 그중 최소/최대, 편차 제곱합은 merge_m2로
+#결과는 부품 번호(vocab)로 인덱싱되는 summary_dtype 배열
+def merge_summaries(summaries, vocab):
+    codes, rows = [], []
+    for summary in summaries:
+        for name, row in summary.items():
+            codes.append(vocab.setdefault(name, len(vocab)))
+            rows.append(row[:5])
+    codes = np.array(codes, dtype='i4')
+    rows = np.array(rows, dtype='f8').reshape(-1, 5)
+
+    merged = np.zeros(len(vocab), dtype=summary_dtype)
+    merged['sum'] = np.bincount(codes, weights=rows[:, 0], minlength=len(vocab))
+    merged['count'] = np.bincount(codes, weights=rows[:, 1], minlength=len(vocab))
+    merged['min'] = np.inf
+    merged['max'] = -np.inf
+    np.minimum.at(merged['min'], codes, rows[:, 2])
+    np.maximum.at(merged['max'], codes, rows[:, 3])
+    merged['m2'] = merge_m2(codes, rows[:, 1], rows[:, 0], rows[:, 4], len(vocab))
+    return merged
+
+#파일별 히스토그램 합치기 -> 부품 번호로 인덱싱되는 (부품 수 x SKETCH_BINS) 배열 (칸 경계가 같아서 더하기만 하면 됨)
+def merge_sketches(summaries, vocab):
+    sketch = np.zeros((len(vocab), SKETCH_BINS), dtype='i8')
+    for summary in summaries:
+        for name, row in summary.items():
+            np.add.at(sketch[vocab[name]], np.array(row[5], dtype='i8'), np.array(row[6], dtype='i8'))
+    return sketch
+
+#부품별 분포 리포트: 평균만 보지 않고 p5/p50/p95, 표준편차, 이상치 개수까지
+#개수/평균/표준편차는 정확한 누적값(합계/개수/편차 제곱합)에서, 분위수/이상치는 히스토그램에서 계산
+report_dtype = [('part_code', 'i4'), ('count', 'i8'), ('mean', 'f8'), ('std', 'f8'),
+                ('p5', 'f8'), ('p50', 'f8'), ('p95', 'f8'), ('outliers', 'i8')]
+
+#부품별 r번째(0부터) 값 추정: r번째 값이 들어 있는 칸을 찾고, 칸 안에서는 값들이 고르게 퍼져 있다고 보고 위치를 정함
+#(오차는 칸 너비 = 값의 1/SUB_BINS 이내)
+def sketch_value(sketch, cum, r):
+    rows = np.arange(len(sketch))
+    bins = np.argmax(cum > r[:, None], axis=1) #누적 개수가 r을 처음 넘는 칸
+    in_bin = sketch[rows, bins]
+    before = cum[rows, bins] - in_bin
+    return BIN_LOW[bins] + (BIN_HIGH[bins] - BIN_LOW[bins]) * (r - before + 0.5) / in_bin
+
+#부품별 q(0~1) 분위수. np.percentile 기본값(linear)처럼 (개수-1)*q 위치 앞뒤 두 값 사이를 보간
+def sketch_percentile(sketch, cum, q):
+    rank = q * (cum[:, -1] - 1)
+    lo = np.floor(rank)
+    low_values = sketch_value(sketch, cum, lo)
+    high_values = sketch_value(sketch, cum, np.ceil(rank))
+    return low_values + (high_values - low_values) * (rank - lo)
+
+#히스토그램에서 (low_fence 미만 + high_fence 초과) 개수. 경계에 걸친 칸은 걸친 비율만큼
+def count_outside(sketch, low_fence, high_fence):
+    width = BIN_HIGH - BIN_LOW
+    with np.errstate(invalid='ignore', divide='ignore'):
+        below = np.where(width > 0, np.clip((low_fence[:, None] - BIN_LOW) / width, 0.0, 1.0), BIN_LOW < low_fence[:, None])
+        above = np.where(width > 0, np.clip((BIN_HIGH - high_fence[:, None]) / width, 0.0, 1.0), BIN_HIGH > high_fence[:, None])
+    return np.rint((sketch * (below + above)).sum(axis=1)).astype('i8')
+
+def strength_report(merged, sketch):
+    codes = np.flatnonzero(sketch.sum(axis=1)) #nan이 아닌 값이 있는 부품만
+    sketch = sketch[codes]
+    parts = merged[codes]
+    report = np.zeros(len(codes), dtype=report_dtype)
+    report['part_code'] = codes
+    report['count'] = parts['count']
+    report['mean'] = parts['sum'] / parts['count']
+    report['std'] = np.sqrt(np.maximum(parts['m2'], 0.0) / parts['count']) #모분산 (np.std 기본값과 같음)
+    if not len(codes):
+        return report
+
+    cum = np.cumsum(sketch, axis=1)
+    #칸 안에서 추정한 값이 실제 최소/최대를 벗어나지 않도록
+    percentile = lambda q: np.clip(sketch_percentile(sketch, cum, q), parts['min'], parts['max'])
+    report['p5'] = percentile(0.05)
+    report['p50'] = percentile(0.50)
+    report['p95'] = percentile(0.95)
+
+    #이상치: 사분위 범위(IQR) 기준 Q1 - 1.5*IQR 미만 또는 Q3 + 1.5*IQR 초과
+    q1 = percentile(0.25)
+    q3 = percentile(0.75)
+    iqr = q3 - q1
+    report['outliers'] = count_outside(sketch, q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+    return report
+
+part_files = [
+    'mars_base_main_parts-001.csv',
+    'mars_base_main_parts-002.csv',
+    'mars_base_main_parts-003.csv',
+]
+
+# 2. 파일별 요약 구하기 (바뀐 파일만 다시 계산)
+cache = load_cache()
+summaries = []
+recomputed = 0
+for file_path in part_files:
+    summary, changed = shard_summary(file_path, cache)
+    summaries.append(summary)
+    recomputed += changed
+
+#목록에서 빠진 파일의 요약은 캐시에서 제거
+cache = {file_path: cache[file_path] for file_path in part_files}
+save_cache(cache)
+print(f'🔄 다시 계산한 파일: {recomputed}개 / 캐시 사용: {len(part_files) - recomputed}개')
+
+# 3. 부품별 평균값 계산 (요약 합치기)
+vocab = {}
+merged = merge_summaries(summaries, vocab)
+
+#part_names[번호] == 이름 (이름 문자열은 부품 종류 수만큼만 저장됨)
+part_names = np.array(list(vocab), dtype=f'U{NAME_LEN}')
+with np.errstate(invalid='ignore', divide='ignore'):
+    means = merged['sum'] / merged['count']
+
+#평균이 50 미만인 부품 번호만 골라서, 기존처럼 이름 순으로 정렬
+low_codes = np.nonzero(means < 50)[0]
+low_codes = low_codes[np.argsort(part_names[low_codes])]
+
+#저장할 때만 번호 -> 이름으로 되돌림
+low_parts = part_names[low_codes]
+low_means = means[low_codes]
 
 # 4. 저장할 배열 생성
 #np.array(..., dtype=...): 구조화 배열 생성
@@ -50,4 +369,24 @@ try:
     np.savetxt('parts_to_work_on.csv', output_array, delimiter=',', fmt='%s,%.3f', header='parts,average_strength', comments='')
     print('✅ parts_to_work_on.csv 저장 완료.')
 except Exception as e:
-    print('⚠️ 파일 저장 중 오류 발생:', e)
\ No newline at end of file
+    print('⚠️ 파일 저장 중 오류 발생:', e)
+
+# 6. 부품별 분포 리포트 저장 (평균만으로는 안 보이는 편차/이상치 확인용)
+#CSV를 다시 읽지 않고 파일별 요약(캐시)의 누적값과 히스토그램을 합쳐서 계산
+report = strength_report(merged, merge_sketches(summaries, vocab))
+report_names = part_names[report['part_code']]
+order = np.argsort(report_names) #기존 결과 파일처럼 이름 순으로
+report, report_names = report[order], report_names[order]
+
+report_array = np.zeros(len(report), dtype=[('parts', f'U{NAME_LEN}')] + report_dtype[1:])
+report_array['parts'] = report_names
+for name, _ in report_dtype[1:]:
+    report_array[name] = report[name]
+
+try:
+    np.savetxt('parts_strength_report.csv', report_array, delimiter=',',
+               fmt='%s,%d,%.3f,%.3f,%.3f,%.3f,%.3f,%d',
+               header='parts,count,mean,std,p5,p50,p95,outliers', comments='')
+    print('✅ parts_strength_report.csv 저장 완료.')
+except Exception as e:
+    print('⚠️ 리포트 저장 중 오류 발생:', e)
@@ -1,11 +1,71 @@
 # mars_mission_computer.py
+# DummySensor 원본. 1-7 ~ 1-9 과제는 저장소 최상위 mars_telemetry 패키지를 통해 이 파일을 그대로 가져다 씀
+# - numpy는 generate_batch()를 처음 부를 때만 import (import만 해도 수십 ms가 걸려서 프로세스 시작이 느려짐)
+# - 공용 센서 인스턴스도 import할 때 만들지 않고 default_sensor()를 처음 부를 때 만듦
 
 import random
+import time
+import importlib
+from array import array
+
+_numpy = None #처음 batch를 만들 때 import한 numpy 모듈 (없으면 False)
+
+#numpy는 대량(batch) 생성에만 사용. 없으면 한 번에 하나씩 만드는 set_env/read만 사용 가능
+def load_numpy():
+    global _numpy
+    if _numpy is None:
+        try:
+            _numpy = importlib.import_module('numpy')
+        except ImportError:
+            _numpy = False
+    return _numpy or None
+
+#센서 키별 값 범위 (최솟값, 최댓값). 키 순서가 곧 batch 배열의 열 순서
+ENV_RANGES = {
+    'mars_base_internal_temperature': (18.0, 30.0),
+    'mars_base_external_temperature': (0.0, 21.0),
+    'mars_base_internal_humidity': (50.0, 60.0),
+    'mars_base_external_illuminance': (500.0, 715.0),
+    'mars_base_internal_co2': (0.02, 0.1),
+    'mars_base_internal_oxygen': (4.0, 7.0)
+}
+
+#채널(센서 키) 순서와 키 -> 인덱스 변환표
+CHANNELS = tuple(ENV_RANGES)
+CHANNEL_INDEX = {key: index for index, key in enumerate(CHANNELS)}
+
+#측정값 하나를 담는 고정 형식 레코드
+#긴 문자열 키를 가진 dict 대신 float 6개짜리 array + 측정 시각만 저장 (__slots__: 인스턴스마다 __dict__를 만들지 않음)
+class EnvReading:
+    __slots__ = ('timestamp', 'values')
+
+    def __init__(self, values, timestamp=None):
+        self.values = values if isinstance(values, array) else array('d', values) #CHANNELS 순서
+        self.timestamp = time.time() if timestamp is None else timestamp
+
+    #reading['mars_base_internal_co2']처럼 dict와 같은 방식으로도 읽을 수 있음
+    def __getitem__(self, key):
+        return self.values[CHANNEL_INDEX[key]]
+
+    def __len__(self):
+        return len(self.values)
+
+    def keys(self):
+        return CHANNELS
+
+    def items(self):
+        return zip(CHANNELS, self.values)
+
+    #출력/저장할 때만 dict로 변환. digits를 주면 그 자리수까지 반올림
+    def to_dict(self, digits=None):
+        if digits is None:
+            return dict(zip(CHANNELS, self.values))
+        return {key: round(value, digits) for key, value in zip(CHANNELS, self.values)}
 
 #관련된 데이터(변수)와 함수(기능)를 하나의 단위로 묶은 것이 class
 class DummySensor:
     #__init__: 객체가 처음 만들어질 때 자동으로 실행되는 함수(생성자 함수, constructor)
-    def __init__(self): #self: 클래스로 만든 객체가 자기 자신의 데이터에 접근할 수 있게 해주는 키워드 (메소드의 첫번째 인자)
+    def __init__(self, seed=None): #self: 클래스로 만든 객체가 자기 자신의 데이터에 접근할 수 있게 해주는 키워드 (메소드의 첫번째 인자)
         #env_values라는 사전객체 만들기
         #self.변수명=값 : 객체 자체 안에 저장되는 변수 (인스턴스 변수)
         self.env_values = { 
@@ -16,21 +76,45 @@ class DummySensor:
             'mars_base_internal_co2': 0.0,
             'mars_base_internal_oxygen': 0.0
         }
+        self.seed = seed #batch 생성용 난수 시드 (같은 시드면 같은 값이 나와서 테스트/시뮬레이션 재현 가능)
+        self.rng = None #numpy 난수 생성기는 처음 batch를 만들 때 생성
 
     #random하게 값을 받더라도 범위를 지정해줘야 해서
     #객체의 env_values라는 dict. 그 dict의 ['키']에 특정 범위의 값을 넣겠다!!
     def set_env(self):
-        self.env_values['mars_base_internal_temperature'] = random.uniform(18.0, 30.0)
-        self.env_values['mars_base_external_temperature'] = random.uniform(0.0, 21.0)
-        self.env_values['mars_base_internal_humidity'] = random.uniform(50.0, 60.0)
-        self.env_values['mars_base_external_illuminance'] = random.uniform(500.0, 715.0)
-        self.env_values['mars_base_internal_co2'] = random.uniform(0.02, 0.1)
-        self.env_values['mars_base_internal_oxygen'] = random.uniform(4.0, 7.0)
+        for key, (low, high) in ENV_RANGES.items(): #범위는 맨 위 ENV_RANGES 한 곳에서만 관리
+            self.env_values[key] = random.uniform(low, high)
 
     #랜덤으로 배정된 그 값이 담긴 env_values를 불러오는 함수
     def get_env(self):
         return self.env_values
 
+    #측정값을 새로 만들어서 EnvReading으로 반환 (env_values dict를 거치지 않음)
+    def read(self):
+        return EnvReading(array('d', [random.uniform(low, high) for low, high in ENV_RANGES.values()]))
+
+    #n개의 측정값을 한 번에 생성 -> (n, 6) 크기의 numpy 배열 (열 순서는 CHANNELS 순서)
+    #random.uniform을 값마다 부르지 않고 numpy가 n x 6개를 한 번에 만들어서 부하 테스트/시뮬레이션용으로 빠름
+    def generate_batch(self, n):
+        np = load_numpy()
+        if np is None:
+            raise ImportError('numpy 모듈이 없어서 batch 생성을 할 수 없습니다.')
+        if self.rng is None:
+            self.rng = np.random.default_rng(self.seed)
+        low = np.array([r[0] for r in ENV_RANGES.values()])
+        high = np.array([r[1] for r in ENV_RANGES.values()])
+        return self.rng.uniform(low, high, size=(n, len(ENV_RANGES))) #열마다 다른 범위 (broadcasting)
+
+
+_default_sensor = None
+
+#여러 MissionComputer가 같이 쓰는 센서 인스턴스 (처음 부를 때 한 번만 생성)
+def default_sensor():
+    global _default_sensor
+    if _default_sensor is None:
+        _default_sensor = DummySensor()
+    return _default_sensor
+
 
 # 인스턴스 생성 및 테스트
 if __name__ == '__main__': #이 코드 파일에서만 실행되도록. 다른 코드 파일에서 DummySensor를 돌리면 이 아래부터는 안 돌아가도록!
@@ -4,37 +4,20 @@ import random
 import time  # 시간 라이브러리
 import json
 
-from P06_mars_mission_computer import DummySensor
-
-ds = DummySensor() #DummySensor ds로 인스턴스화
+from P06_mars_mission_computer import default_sensor, EnvReading, CHANNELS
 
 class MissionComputer:
     def __init__(self):
-        self.env_values = {
-            'mars_base_internal_temperature': 0.0,
-            'mars_base_external_temperature': 0.0,
-            'mars_base_internal_humidity': 0.0,
-            'mars_base_external_illuminance': 0.0,
-            'mars_base_internal_co2': 0.0,
-            'mars_base_internal_oxygen': 0.0
-        }
-        self.sensor = ds #MissionComputer 클래스 안에서 DummySensor를 사용할 수 있게 연결해주는 역할
+        self.env_values = EnvReading([0.0] * len(CHANNELS)) #가장 최근 측정값 (CHANNELS 순서의 고정 형식 레코드)
+        self.sensor = default_sensor() #MissionComputer 클래스 안에서 DummySensor를 사용할 수 있게 연결해주는 역할
 
     def get_sensor_data(self):
         while True:
-            self.sensor.set_env()
-            self.env_values = self.sensor.get_env()
+            self.env_values = self.sensor.read() #set_env + get_env처럼 dict를 복사하지 않고 측정값 레코드 하나만 만듦
 
             print('📡 환경 정보:')
 
-            
-        
-            rounded_env_values = {
-                key: round(value, 3) if isinstance(value, (int, float)) else value
-                 for key, value in self.env_values.items()
-                }
-
-            print(json.dumps(rounded_env_values, indent=4))
+            print(json.dumps(self.env_values.to_dict(3), indent=4)) #소수점 3자리 반올림은 출력할 때 한 번만
 
             '''
             print('{')
@@ -2,57 +2,47 @@ import random
 import time
 import json
 
-from P06_mars_mission_computer import DummySensor
+from P06_mars_mission_computer import default_sensor, EnvReading, CHANNELS
+from rolling_stats import RollingStats, STAT_WINDOWS
 
-ds = DummySensor() #DummySensor ds로 인스턴스화
+AVERAGE_WINDOW = 12 #평균 출력 주기 (1분=12회, 5분일 경우 60)
 
 class MissionComputer:
     def __init__(self):
-        self.sensor = ds
-        self.env_values = {key: 0.0 for key in ds.env_values}
-        self.history = {key: [] for key in self.env_values}  # key : []로 누적값 저장할 dict생성
+        self.sensor = default_sensor() #공용 센서는 처음 MissionComputer를 만들 때 생성
+        self.env_values = EnvReading([0.0] * len(CHANNELS)) #가장 최근 측정값 (dict 대신 고정 형식 레코드)
+        self.stats = RollingStats(CHANNELS, STAT_WINDOWS)  # 1분/5분/1시간 구간별 평균/최소/최대/분산을 값이 들어올 때마다 갱신
 
     def get_sensor_data(self):
         count = 0 #반복 횟수 카운트 위해 count변수 설정
         while True:
 
             # 센서 값 수집 및 저장
-            self.sensor.set_env()
-            self.env_values = self.sensor.get_env()
+            self.env_values = self.sensor.read()
 
-            for key in self.env_values:
-                self.history[key].append(self.env_values[key])
+            self.stats.update(self.env_values)
 
 
             # 출력
             print('📡 현재 환경 정보:')
-            rounded_env_values = {
-                key: round(value, 3) if isinstance(value, (int, float)) else value
-                 for key, value in self.env_values.items()
-                }
-
-            print(json.dumps(rounded_env_values, indent=4))
+            print(json.dumps(self.env_values.to_dict(3), indent=4)) #출력할 때만 dict로 바꾸면서 소수점 3자리 반올림
 
             count += 1 #반복문 도는 횟수 카운트
             time.sleep(5)
 
             # 5분(=300초 = 60회)마다 평균값 출력
             #1분(=60초=12회)
-            if count % 12 == 0: #빠른 시연 위해 1분으로 설정, 후에 count % 60 == 0 으로 변경
+            if count % AVERAGE_WINDOW == 0: #빠른 시연 위해 1분으로 설정, 후에 count % 60 == 0 으로 변경
                 print('\n🧮 최근 1분간 평균값:') #빠른 시연 위해 1분으로 설정. 후에 5분으로 변경
-                averaged_values = {}
-
-                for key in self.history:
-                    values = self.history[key][-12:]  # 최근 12개만 사용(5분일 경우 60)
-                    if values:  # 리스트가 비어있지 않다면
-                      avg = sum(values) / len(values)
-                      averaged_values[key] = round(avg, 3)  # 소수점 3자리까지
-                    else:  # 아직 값이 하나도 누적되지 않은 경우
-                      averaged_values[key] = None  # 또는 'N/A', 0.0 등으로 대체 가능
+                snapshot = self.stats.snapshot()
+                averaged_values = {key: stats['mean'] for key, stats in snapshot['1min'].items()}  # 아직 값이 없으면 None
 
                 # JSON 형식으로 평균값 출력
                 print(json.dumps(averaged_values, indent=4))
 
+                print('\n📈 구간별(1분/5분/1시간) 평균/최소/최대/분산:')
+                print(json.dumps(snapshot, indent=4))
+
                 print('\n▶ 계속하려면 Enter, 중지하려면 "stop" 입력:') #1분/5분에 한번 계속 이어갈지 멈출지 결정 가능
                 try:
                     user_input = input() #input()에 try를 걸지 않으면 다른 행동 발생 시 오류 발생
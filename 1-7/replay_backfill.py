@@ -0,0 +1,73 @@
+# replay_backfill.py
+# 저장된 센서 기록을 mars_mission_computer_bonus.py와 같은 구간 통계 코드(rolling_stats.RollingStats)로 다시 계산하는 도구
+# - time.sleep(5) 없이 기록을 최대 속도로 통과시킴 -> 몇 달치 평균도 몇 초 만에 다시 계산(backfill)
+# - 보너스 과제와 같은 주기(AVERAGE_WINDOW개마다)로 구간별 평균/최소/최대/분산을 CSV로 저장
+# - 처리량(초당 개수)과 시간 압축 배율(기록 기간 / 처리 시간) 출력
+#
+# 사용법:
+#   python replay_backfill.py 기록파일.csv            (timestamp + 센서 키 6개 열)
+#   python replay_backfill.py telemetry.db -o out.csv  (1-9 TelemetryStore 파일)
+
+import argparse
+import csv
+import sqlite3
+import time
+
+import telemetry_path  # noqa: F401 (mars_telemetry를 import할 수 있도록 경로 설정)
+from P06_mars_mission_computer import CHANNELS
+from mars_telemetry.history import iter_history #1-9 ReplaySource와 같은 기록 파일 읽기 코드
+from rolling_stats import RollingStats, STAT_WINDOWS
+from mars_mission_computer_bonus import AVERAGE_WINDOW
+
+STATS = ('mean', 'min', 'max', 'variance')
+
+
+def backfill(path, out_path, every=AVERAGE_WINDOW, windows=STAT_WINDOWS):
+    stats = RollingStats(CHANNELS, windows)
+    header = ['timestamp'] + [f'{window}_{key}_{stat}' for window in windows for key in CHANNELS for stat in STATS]
+
+    count = 0
+    first_ts = last_ts = None
+    started = time.perf_counter()
+    with open(out_path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        for reading in iter_history(path):
+            stats.update(reading)
+            count += 1
+            if first_ts is None:
+                first_ts = reading.timestamp
+            last_ts = reading.timestamp
+
+            if count % every == 0: #보너스 과제에서 평균을 출력하던 시점과 같음
+                snapshot = stats.snapshot()
+                writer.writerow([reading.timestamp] + [
+                    snapshot[window][key][stat] for window in windows for key in CHANNELS for stat in STATS
+                ])
+    elapsed = time.perf_counter() - started
+
+    print(f'✅ {out_path} 저장 완료.')
+    print(f'▶ 처리: {count}개 / {elapsed:.2f}초 ({count / elapsed if elapsed else 0:.0f}개/초)')
+    if count > 1 and elapsed > 0:
+        span = last_ts - first_ts
+        print(f'▶ 기록 기간: {span / 86400:.2f}일 -> 시간 압축 {span / elapsed:,.0f}배')
+    return count, elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='저장된 센서 기록으로 구간 통계를 다시 계산(backfill)합니다.')
+    parser.add_argument('history', help='기록 파일 (.csv 또는 telemetry.db)')
+    parser.add_argument('-o', '--out', default='backfill_stats.csv', help='결과 CSV 파일 (기본: backfill_stats.csv)')
+    parser.add_argument('--every', type=int, default=AVERAGE_WINDOW, help=f'몇 개마다 통계를 기록할지 (기본: {AVERAGE_WINDOW})')
+    args = parser.parse_args()
+
+    try:
+        backfill(args.history, args.out, args.every)
+    except FileNotFoundError:
+        print('❌ 파일을 찾을 수 없습니다. 경로를 다시 확인해주세요.')
+    except (ValueError, sqlite3.Error) as e:
+        print('❌ 기록 파일을 읽는 도중 오류가 발생했습니다:', str(e))
+
+
+if __name__ == '__main__':
+    main()
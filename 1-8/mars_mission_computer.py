@@ -1,57 +1,50 @@
 import platform #운영체제(OS), CPU 등에 대한 정보를 얻을 수 있는 표준 라이브러리
 import os #운영체제 관련 함수들 (예: CPU 개수 등)
 import json # 딕셔너리를 JSON 형식으로 보기 좋게 출력하기 위한 표준 라이브러리
+import time
 
-from P06_mars_mission_computer import DummySensor
+import telemetry_path  # noqa: F401 (mars_telemetry를 import할 수 있도록 경로 설정)
+from P06_mars_mission_computer import default_sensor, load_optional, EnvReading, CHANNELS
+from mars_telemetry.rolling_stats import RingBuffer #센서 값 누적용 고정 크기 링 버퍼 (1-7/1-9와 같은 코드)
 
-try:
-    import psutil  # 시스템 정보 수집용으로 예외적으로 허용된 라이브러리(설치 여부 확인하는 과정)
-except ImportError:
-    print("⚠️ psutil 모듈이 설치되어 있지 않습니다. 시스템 부하 정보를 가져올 수 없습니다.")
-    psutil = None
+#psutil은 시스템 정보/부하를 처음 조회할 때 import (시스템 정보 수집용으로 예외적으로 허용된 라이브러리)
+PSUTIL_WARNING = "⚠️ psutil 모듈이 설치되어 있지 않습니다. 시스템 부하 정보를 가져올 수 없습니다."
 
-ds = DummySensor() #DummySensor ds로 인스턴스화
+AVERAGE_WINDOW = 12 #평균 낼 최근 값 개수 (1분=12회, 5분일 경우 60)
 
 class MissionComputer:
     def __init__(self):
-        self.sensor = ds
-        self.env_values = {key: 0.0 for key in ds.env_values}
-        self.history = {key: [] for key in self.env_values}  # key : []로 누적값 저장할 dict생성
+        self.sensor = default_sensor() #공용 센서는 처음 MissionComputer를 만들 때 생성
+        self.env_values = EnvReading([0.0] * len(CHANNELS)) #가장 최근 측정값 (dict 대신 고정 형식 레코드)
+        self.history = [RingBuffer(AVERAGE_WINDOW) for _ in CHANNELS]  # CHANNELS 순서 : 최근 AVERAGE_WINDOW개만 저장하는 링 버퍼
 
     def get_sensor_data(self):
         count = 0 #반복 횟수 카운트 위해 count변수 설정
         while True:
 
-            # 센서 값 수집 및 저장
-            self.sensor.set_env()
-            self.env_values = self.sensor.get_env()
+            # 센서 값 수집 및 저장 (read(): set_env + get_env처럼 dict를 복사하지 않고 측정값 레코드 하나만 만듦)
+            self.env_values = self.sensor.read()
 
-            for key in self.env_values:
-                self.history[key].append(self.env_values[key])
+            for buffer, value in zip(self.history, self.env_values.values):
+                buffer.append(value)
 
 
             # 출력
             print('📡 현재 환경 정보:')
-            rounded_env_values = {
-                key: round(value, 3) if isinstance(value, (int, float)) else value
-                 for key, value in self.env_values.items()
-                }
-
-            print(json.dumps(rounded_env_values, indent=4))
+            print(json.dumps(self.env_values.to_dict(3), indent=4)) #소수점 3자리 반올림은 출력할 때 한 번만
 
             count += 1 #반복문 도는 횟수 카운트
             time.sleep(5)
 
             # 5분(=300초 = 60회)마다 평균값 출력
             #1분(=60초=12회)
-            if count % 12 == 0: #빠른 시연 위해 1분으로 설정, 후에 count % 60 == 0 으로 변경
+            if count % AVERAGE_WINDOW == 0: #빠른 시연 위해 1분으로 설정, 후에 count % 60 == 0 으로 변경
                 print('\n🧮 최근 1분간 평균값:') #빠른 시연 위해 1분으로 설정. 후에 5분으로 변경
                 averaged_values = {}
 
-                for key in self.history:
-                    values = self.history[key][-12:]  # 최근 12개만 사용(5분일 경우 60)
-                    if values:  # 리스트가 비어있지 않다면
-                      avg = sum(values) / len(values)
+                for key, buffer in zip(CHANNELS, self.history):
+                    avg = buffer.mean()  # 링 버퍼에는 최근 AVERAGE_WINDOW개만 있음, 합계를 들고 있어서 바로 평균
+                    if avg is not None:  # 버퍼가 비어있지 않다면
                       averaged_values[key] = round(avg, 3)  # 소수점 3자리까지
                     else:  # 아직 값이 하나도 누적되지 않은 경우
                       averaged_values[key] = None  # 또는 'N/A', 0.0 등으로 대체 가능
@@ -72,6 +65,7 @@ class MissionComputer:
     #여기부터 추가하는 메소드!!
     def get_mission_computer_info(self): #메소드 이름 get_mission_computer_info
         try:
+            psutil = load_optional('psutil', PSUTIL_WARNING)
             info = {
                 "Operating System": platform.system(), #운영체계 이름을 문자열로
                 "OS Version": platform.version(), #운영체계 버전 
@@ -91,6 +85,7 @@ class MissionComputer:
     #컴퓨터에 부하를 일으키는 코드
     def get_mission_computer_load(self):
         try:
+            psutil = load_optional('psutil', PSUTIL_WARNING)
             if psutil is None:
                 raise ImportError("psutil 모듈이 없어서 부하 정보를 가져올 수 없습니다.")
 
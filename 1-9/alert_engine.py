@@ -0,0 +1,115 @@
+# alert_engine.py
+# 센서 측정값이 안전 범위를 벗어나면 알림(alert)을 만드는 규칙 엔진
+# - ThresholdRule: 값이 low 미만 / high 초과
+# - RateRule: 값의 변화 속도(초당 변화량)가 max_rate 초과
+# - hysteresis: 경보 해제는 경계에서 hysteresis만큼 더 안쪽으로 돌아와야 함 (경계 근처에서 켜졌다 꺼졌다 반복 방지)
+# - debounce: 연속 debounce번 조건을 만족해야 경보/해제 (한 번 튀는 값 무시)
+# - 규칙은 시작할 때 (채널 인덱스, 기준값...) 튜플로 바꿔두고(compile), 측정값마다 규칙 수만큼만 비교 (O(규칙 수))
+# - 상태 변화가 있을 때만 알림 dict를 만들어 큐에 넣음 (평소에는 새 객체를 만들지 않음)
+
+import queue
+
+from P06_mars_mission_computer import CHANNEL_INDEX
+
+
+class ThresholdRule:
+    def __init__(self, name, channel, low=None, high=None, hysteresis=0.0, debounce=1):
+        self.name = name
+        self.channel = channel
+        self.low = float('-inf') if low is None else low
+        self.high = float('inf') if high is None else high
+        self.hysteresis = hysteresis
+        self.debounce = debounce
+
+
+class RateRule:
+    def __init__(self, name, channel, max_rate, debounce=1):
+        self.name = name
+        self.channel = channel
+        self.max_rate = max_rate #초당 최대 변화량 (절댓값)
+        self.debounce = debounce
+
+
+#화성 기지 내부 환경 기본 규칙
+#기준값은 DummySensor의 정상 범위(ENV_RANGES) 바깥에 둠 (정상 측정값으로는 경보가 나지 않고, 범위를 벗어난 값만 경보)
+#- 산소 4.0~7.0 / CO2 0.02~0.1 / 내부 온도 18~30
+#- 변화 속도: 5초 간격 정상 측정값의 최대 변화는 (30 - 18) / 5 = 2.4/초 -> 3.0/초 초과만 경보
+DEFAULT_RULES = [
+    ThresholdRule('oxygen_low', 'mars_base_internal_oxygen', low=3.8, hysteresis=0.2, debounce=2),
+    ThresholdRule('co2_high', 'mars_base_internal_co2', high=0.11, hysteresis=0.005, debounce=2),
+    ThresholdRule('internal_temperature', 'mars_base_internal_temperature', low=17.0, high=31.0, hysteresis=0.5, debounce=2),
+    RateRule('internal_temperature_rate', 'mars_base_internal_temperature', max_rate=3.0, debounce=2),
+]
+
+
+class AlertEngine:
+    def __init__(self, rules=DEFAULT_RULES, alert_queue=None):
+        self.queue = alert_queue if alert_queue is not None else queue.SimpleQueue()
+        self.names = [rule.name for rule in rules]
+        self.channels = [rule.channel for rule in rules]
+
+        #compile: (종류, 채널 인덱스, 기준값들) 튜플 -> 평가할 때 속성/딕셔너리 조회 없이 인덱스로 바로 접근
+        self.compiled = []
+        for rule in rules:
+            index = CHANNEL_INDEX[rule.channel]
+            if isinstance(rule, ThresholdRule):
+                self.compiled.append((0, index, rule.low, rule.high, rule.low + rule.hysteresis, rule.high - rule.hysteresis, rule.debounce))
+            else:
+                self.compiled.append((1, index, rule.max_rate, 0.0, 0.0, 0.0, rule.debounce))
+
+        #규칙별 상태 (미리 만든 리스트의 값만 바꿈)
+        self.active = [False] * len(rules) #현재 경보 중인지
+        self.streak = [0] * len(rules) #현재 상태와 반대 조건이 연속으로 나온 횟수
+        self.prev_values = None #변화 속도 계산용 직전 값
+        self.prev_time = 0.0
+
+    #측정값 하나 평가 -> 경보가 켜지거나 꺼진 규칙만 큐에 넣음. 반환값: 이번에 상태가 바뀐 규칙 수
+    def evaluate(self, reading):
+        values = reading.values
+        prev_values = self.prev_values
+        elapsed = reading.timestamp - self.prev_time
+        active = self.active
+        streak = self.streak
+        changed = 0
+
+        for i, (kind, index, a, b, clear_low, clear_high, debounce) in enumerate(self.compiled):
+            value = values[index]
+            if kind == 0:
+                if active[i]:
+                    flip = clear_low <= value <= clear_high #해제 조건: hysteresis만큼 안쪽으로 돌아옴
+                else:
+                    flip = value < a or value > b
+            else:
+                if prev_values is None or elapsed <= 0:
+                    continue
+                too_fast = abs(value - prev_values[index]) / elapsed > a
+                flip = not too_fast if active[i] else too_fast
+
+            if not flip:
+                streak[i] = 0
+                continue
+            streak[i] += 1
+            if streak[i] >= debounce:
+                streak[i] = 0
+                active[i] = not active[i]
+                changed += 1
+                self.queue.put({
+                    'rule': self.names[i],
+                    'channel': self.channels[i],
+                    'state': 'ALERT' if active[i] else 'CLEAR',
+                    'value': value,
+                    'timestamp': reading.timestamp,
+                })
+
+        self.prev_values = values
+        self.prev_time = reading.timestamp
+        return changed
+
+    #큐에 쌓인 알림을 모두 꺼냄
+    def drain(self):
+        alerts = []
+        while True:
+            try:
+                alerts.append(self.queue.get_nowait())
+            except queue.Empty:
+                return alerts
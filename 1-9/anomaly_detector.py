@@ -0,0 +1,96 @@
+# anomaly_detector.py
+# 고정 기준값(alert_engine.py)으로는 못 잡는 센서 이상을 찾는 모듈
+# - 채널마다 EWMA(지수 가중 이동) 평균/분산 두 벌만 저장 -> 과거 측정값을 저장하지 않고 값 하나당 O(1)
+#   fast: 최근 값 위주 (alpha=0.05, 대략 최근 40개) / baseline: 오래 기억하는 기준 (alpha=0.002, 대략 최근 1000개)
+# - SPIKE: z = (값 - fast 평균) / fast 표준편차, |z| > threshold면 그 값 하나를 이상값으로 표시
+#   이상값은 평균 ± threshold·표준편차로 잘라서 반영 -> 한 번 튄 값이 기준을 크게 흔들지 않음
+# - DRIFT: 센서가 조금씩 한쪽으로 밀리면 fast 평균은 따라가 버려서 SPIKE로는 안 잡힘
+#   -> fast 평균이 baseline 평균에서 벗어난 정도를 z로 계산해서 threshold를 넘으면 DRIFT, 절반 안쪽으로 돌아오면 해제
+#   (DRIFT는 켜질 때/꺼질 때만 알림)
+# - 처음에는 alpha 대신 1/개수로 반영(= 단순 누적 평균) -> 첫 값에 치우친 기준으로 잘못 표시하지 않도록
+# - 처음 warmup개는 기준을 만드는 기간이라 표시하지 않음
+
+import math
+from array import array
+
+from P06_mars_mission_computer import CHANNELS
+
+FAST_ALPHA = 0.05 #새 값 반영 비율 (작을수록 오래된 값을 오래 기억)
+BASELINE_ALPHA = 0.002
+Z_THRESHOLD = 4.0
+WARMUP = 100
+
+
+class AnomalyDetector:
+    def __init__(self, channels=CHANNELS, fast_alpha=FAST_ALPHA, baseline_alpha=BASELINE_ALPHA, threshold=Z_THRESHOLD, warmup=WARMUP):
+        size = len(channels)
+        self.channels = channels
+        self.fast_alpha = fast_alpha
+        self.baseline_alpha = baseline_alpha
+        self.threshold = threshold
+        self.warmup = warmup
+        #값이 서로 독립이면 EWMA 평균 자체의 분산 = 원래 분산 x alpha / (2 - alpha)
+        self.fast_noise = fast_alpha / (2.0 - fast_alpha)
+        self.base_noise = baseline_alpha / (2.0 - baseline_alpha)
+        self.fast_mean = array('d', [0.0] * size)
+        self.fast_var = array('d', [0.0] * size)
+        self.base_mean = array('d', [0.0] * size)
+        self.base_var = array('d', [0.0] * size)
+        self.drifting = [False] * size
+        self.count = 0
+
+    #측정값 하나 반영 -> 이상 목록 [(종류, 채널, 값, z), ...] (없으면 빈 튜플, 평소에는 새 객체를 만들지 않음)
+    #종류: 'SPIKE' / 'DRIFT' / 'DRIFT_CLEAR'
+    def update(self, reading):
+        values = reading.values
+        fast_mean, fast_var = self.fast_mean, self.fast_var
+        base_mean, base_var = self.base_mean, self.base_var
+        threshold = self.threshold
+        self.count += 1
+        fast_alpha = max(self.fast_alpha, 1.0 / self.count)
+        base_alpha = max(self.baseline_alpha, 1.0 / self.count)
+        #fast 평균과 baseline 평균 차이의 표준편차 (원래 표준편차 대비 비율)
+        drift_noise = math.sqrt(max(self.fast_noise, 1.0 / self.count) + max(self.base_noise, 1.0 / self.count))
+
+        check = self.count > self.warmup
+        anomalies = ()
+        for i, value in enumerate(values):
+            diff = value - fast_mean[i]
+            std = math.sqrt(fast_var[i])
+            if check and std > 0.0:
+                z = diff / std
+                if abs(z) > threshold:
+                    if not anomalies:
+                        anomalies = []
+                    anomalies.append(('SPIKE', self.channels[i], value, z))
+                    diff = math.copysign(threshold * std, diff) #기준에는 잘라낸 값만 반영
+            increment = fast_alpha * diff
+            fast_mean[i] += increment
+            fast_var[i] = (1.0 - fast_alpha) * (fast_var[i] + diff * increment)
+
+            clipped = fast_mean[i] + diff - increment #fast에 반영한 값과 같은 값(잘라낸 값)으로 baseline도 갱신
+            base_diff = clipped - base_mean[i]
+            base_increment = base_alpha * base_diff
+            base_mean[i] += base_increment
+            base_var[i] = (1.0 - base_alpha) * (base_var[i] + base_diff * base_increment)
+
+            if check and base_var[i] > 0.0:
+                drift_z = (fast_mean[i] - base_mean[i]) / (math.sqrt(base_var[i]) * drift_noise)
+                if self.drifting[i] != (abs(drift_z) > (threshold / 2 if self.drifting[i] else threshold)):
+                    self.drifting[i] = not self.drifting[i]
+                    if not anomalies:
+                        anomalies = []
+                    anomalies.append(('DRIFT' if self.drifting[i] else 'DRIFT_CLEAR', self.channels[i], fast_mean[i], drift_z))
+        return anomalies
+
+    #채널별 현재 기준 {채널: {mean, std, baseline, drifting}}
+    def snapshot(self, digits=3):
+        return {
+            key: {
+                'mean': round(self.fast_mean[i], digits),
+                'std': round(math.sqrt(self.fast_var[i]), digits),
+                'baseline': round(self.base_mean[i], digits),
+                'drifting': self.drifting[i],
+            }
+            for i, key in enumerate(self.channels)
+        }
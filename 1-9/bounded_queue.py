@@ -0,0 +1,61 @@
+# bounded_queue.py
+# 크기 제한이 있는 생산자-소비자 큐
+# - 소비자(저장 스레드 등)가 느려지거나 멈춰도 큐가 메모리를 끝없이 차지하지 않음
+# - 큐가 가득 찼을 때 정책(policy)
+#   'block'      : 자리가 날 때까지 최대 timeout초 기다림 (생산자를 늦춰서 속도를 맞춤 = backpressure), 그래도 가득 차면 새 값 버림
+#   'drop_newest': 기다리지 않고 새 값을 버림
+#   'drop_oldest': 가장 오래된 값을 버리고 새 값을 넣음 (최신 값이 더 중요한 센서 데이터용)
+# - 버린 개수는 dropped에 누적
+
+import queue
+
+POLICIES = ('block', 'drop_newest', 'drop_oldest')
+
+
+class BoundedQueue:
+    def __init__(self, maxsize, policy='drop_oldest', timeout=1.0):
+        if policy not in POLICIES:
+            raise ValueError(f'지원하지 않는 큐 정책입니다: {policy}')
+        self.queue = queue.Queue(maxsize)
+        self.policy = policy
+        self.timeout = timeout #'block'일 때 최대 대기 시간(초)
+        self.dropped = 0
+
+    #넣었으면 True, 버렸으면 False
+    def put(self, item):
+        try:
+            if self.policy == 'block':
+                self.queue.put(item, timeout=self.timeout)
+            else:
+                self.queue.put_nowait(item)
+            return True
+        except queue.Full:
+            pass
+
+        if self.policy == 'drop_oldest':
+            while True:
+                try:
+                    self.queue.get_nowait()
+                    self.dropped += 1
+                except queue.Empty:
+                    pass
+                try:
+                    self.queue.put_nowait(item)
+                    return True
+                except queue.Full: #그 사이 다른 생산자가 먼저 넣었으면 한 번 더
+                    continue
+        self.dropped += 1
+        return False
+
+    #정책과 상관없이 자리가 날 때까지 기다려서 넣음 (종료 신호처럼 절대 버리면 안 되는 값)
+    def put_wait(self, item):
+        self.queue.put(item)
+
+    def get(self, timeout=None):
+        return self.queue.get(timeout=timeout)
+
+    def get_nowait(self):
+        return self.queue.get_nowait()
+
+    def __len__(self):
+        return self.queue.qsize()
@@ -0,0 +1,211 @@
+# fleet_aggregator.py
+# 여러 기지(모듈)의 MissionComputer를 한 호스트에서 동시에 돌리고, 측정값을 시각에 맞춰 합쳐서 기지 전체(fleet) 통계를 내는 모듈
+# - 기지 N개를 worker 프로세스 W개에 나눠 맡김. worker 하나는 이벤트 루프 하나에서 맡은 기지들을 모두 처리
+#   (기지마다 프로세스/스레드를 만들지 않음 -> 기지 수백 개도 프로세스 W개로 감당)
+# - 모든 worker가 벽시계 기준 interval 경계(tick)에 맞춰 측정 -> tick 번호가 같으면 같은 시각의 측정값
+# - worker는 tick마다 맡은 기지들의 채널별 부분 통계(개수, 평균, 제곱편차합 M2, 최소, 최대)만 보냄 (측정값 전체를 보내지 않음)
+# - 부모는 같은 tick의 부분 통계를 합쳐서(Chan 병렬 분산 공식) 기지 전체 평균/표준편차/최소/최대를 바로 계산
+#   기지 전체 평균은 RollingStats에 넣어서 1분/5분/1시간 구간 통계도 이어서 계산 (과거 측정값은 저장하지 않음)
+# - workers=0이면 프로세스 없이 현재 이벤트 루프 하나에서 실행
+#
+# 사용법: python fleet_aggregator.py 기지수 [worker수] [측정주기(초)]
+
+import os
+import sys
+import json
+import math
+import time
+import queue
+import asyncio
+import multiprocessing
+
+from P06_mars_mission_computer import DummySensor, EnvReading, CHANNELS
+from rolling_stats import RollingStats
+from mars_mission_computer import MissionComputer, SENSOR_INTERVAL
+
+LATE_TICKS = 2 #이보다 오래된 tick은 worker가 다 보내지 않았어도 있는 값만으로 확정 (느린 worker 하나 때문에 전체가 멈추지 않도록)
+
+
+#기지 하나 = MissionComputer 하나 (측정값/경보는 출력하지 않고 통계에만 사용)
+class FleetModule(MissionComputer):
+    def __init__(self, module_id, sensor=None):
+        super().__init__(sensor=sensor if sensor is not None else DummySensor(), verbose=False)
+        self.module_id = module_id #verbose=False라 경보/이상은 출력하지 않음 (경보 상태는 self.alerts.active에 남아 있어서 tick마다 개수만 셈)
+
+
+#채널별 부분 통계: (기지 수, 평균 리스트, M2 리스트, 최소 리스트, 최대 리스트)
+def empty_partial():
+    size = len(CHANNELS)
+    return [0, [0.0] * size, [0.0] * size, [math.inf] * size, [-math.inf] * size]
+
+
+#부분 통계 두 개 합치기 (Chan 병렬 분산 공식) -> total을 직접 고침
+def merge_partial(total, part):
+    n_a, n_b = total[0], part[0]
+    if n_b == 0:
+        return total
+    n = n_a + n_b
+    means, m2s, lows, highs = total[1], total[2], total[3], total[4]
+    for i in range(len(means)):
+        delta = part[1][i] - means[i]
+        means[i] += delta * n_b / n
+        m2s[i] += part[2][i] + delta * delta * n_a * n_b / n
+        lows[i] = min(lows[i], part[3][i])
+        highs[i] = max(highs[i], part[4][i])
+    total[0] = n
+    return total
+
+
+#worker 하나가 맡은 기지들
+class FleetShard:
+    def __init__(self, module_ids):
+        self.modules = [FleetModule(module_id) for module_id in module_ids]
+
+    #모든 기지를 한 번씩 측정 -> (tick, 부분 통계, 경보 중인 규칙 수)
+    def tick(self, tick):
+        partial = empty_partial()
+        n, means, m2s, lows, highs = partial
+        active_alerts = 0
+        for module in self.modules:
+            module.read_sensor_once() #기지마다 저장/통계/경보 파이프라인은 그대로 실행
+            n += 1
+            for i, value in enumerate(module.env_values.values): #기지 간 Welford 누적
+                delta = value - means[i]
+                means[i] += delta / n
+                m2s[i] += delta * (value - means[i])
+                if value < lows[i]:
+                    lows[i] = value
+                if value > highs[i]:
+                    highs[i] = value
+            active_alerts += sum(module.alerts.active)
+        partial[0] = n
+        return tick, partial, active_alerts
+
+
+#다음 interval 경계마다 shard.tick() 결과를 emit으로 보냄 (ticks개 보내면 종료, None이면 계속)
+async def shard_loop(shard, interval, emit, ticks=None):
+    count = 0
+    while ticks is None or count < ticks:
+        now = time.time()
+        tick = math.floor(now / interval) + 1 #처리가 늦어져 경계를 넘겼으면 다음 경계로 (몰아서 실행하지 않음)
+        await asyncio.sleep(tick * interval - now)
+        emit(shard.tick(tick))
+        count += 1
+
+
+def run_worker(module_ids, interval, out_queue, ticks=None):
+    asyncio.run(shard_loop(FleetShard(module_ids), interval, out_queue.put, ticks))
+
+
+#worker들이 보낸 부분 통계를 tick별로 모아서 시각 순서대로 기지 전체 통계를 만듦
+class FleetAggregator:
+    def __init__(self, shards, interval=SENSOR_INTERVAL):
+        self.shards = shards
+        self.interval = interval
+        self.pending = {} #tick -> [받은 worker 수, 부분 통계 합, 경보 수]
+        self.last_tick = None #마지막으로 확정한 tick
+        self.late = 0 #이미 확정한 tick에 늦게 도착한 부분 통계 수
+        self.stats = RollingStats(CHANNELS, sample_interval=interval) #기지 전체 평균의 구간 통계
+
+    #부분 통계 하나 추가 -> 이번에 확정된 tick들의 통계 리스트 (시각 순서)
+    def add(self, report):
+        tick, partial, active_alerts = report
+        if self.last_tick is not None and tick <= self.last_tick:
+            self.late += 1
+            return []
+        entry = self.pending.setdefault(tick, [0, empty_partial(), 0])
+        entry[0] += 1
+        merge_partial(entry[1], partial)
+        entry[2] += active_alerts
+
+        ready = []
+        for pending_tick in sorted(self.pending):
+            complete = self.pending[pending_tick][0] >= self.shards
+            if not complete and pending_tick > tick - LATE_TICKS:
+                break #앞 tick이 아직이면 뒤 tick도 기다림 (순서 유지)
+            ready.append(self._finish(pending_tick))
+        return ready
+
+    #남은 tick을 모두 확정 (종료할 때)
+    def flush(self):
+        return [self._finish(tick) for tick in sorted(self.pending)]
+
+    def _finish(self, tick):
+        reports, (n, means, m2s, lows, highs), active_alerts = self.pending.pop(tick)
+        self.last_tick = tick
+        timestamp = tick * self.interval
+        self.stats.update(EnvReading(means, timestamp=timestamp))
+        return {
+            'timestamp': timestamp,
+            'modules': n,
+            'workers': f'{reports}/{self.shards}',
+            'active_alerts': active_alerts,
+            'channels': {
+                key: {
+                    'mean': round(means[i], 3),
+                    'std': round(math.sqrt(m2s[i] / n), 3) if n else None,
+                    'min': round(lows[i], 3),
+                    'max': round(highs[i], 3),
+                }
+                for i, key in enumerate(CHANNELS)
+            },
+        }
+
+
+def print_fleet(snapshot):
+    print(f"🛰️ Fleet ({snapshot['modules']}개 기지, worker {snapshot['workers']}, 경보 {snapshot['active_alerts']}개):")
+    print(json.dumps(snapshot['channels'], indent=4))
+
+
+#기지 n_modules개를 workers개 프로세스로 실행 (workers=None이면 CPU 코어 수, 0이면 현재 프로세스에서)
+def run_fleet(n_modules, workers=None, interval=SENSOR_INTERVAL, ticks=None, report=print_fleet):
+    if workers is None:
+        workers = min(n_modules, os.cpu_count() or 1)
+    aggregator = FleetAggregator(max(workers, 1), interval)
+
+    if workers == 0:
+        def emit(result):
+            for snapshot in aggregator.add(result):
+                report(snapshot)
+        asyncio.run(shard_loop(FleetShard(range(n_modules)), interval, emit, ticks))
+        return aggregator
+
+    out_queue = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(target=run_worker, args=(list(range(n_modules))[i::workers], interval, out_queue, ticks), daemon=True)
+        for i in range(workers)
+    ]
+    try:
+        for process in processes:
+            process.start()
+        while True:
+            try:
+                result = out_queue.get(timeout=interval * 2)
+            except queue.Empty:
+                if not any(process.is_alive() for process in processes):
+                    break
+                continue
+            for snapshot in aggregator.add(result):
+                report(snapshot)
+        for snapshot in aggregator.flush():
+            report(snapshot)
+    finally:
+        for process in processes:
+            process.terminate()
+            process.join()
+    return aggregator
+
+
+if __name__ == "__main__":
+    if len(sys.argv) < 2:
+        print("사용법: python fleet_aggregator.py 기지수 [worker수] [측정주기(초)]")
+        sys.exit(1)
+    multiprocessing.set_start_method("spawn")  # Windows 안전용
+    try:
+        run_fleet(
+            int(sys.argv[1]),
+            int(sys.argv[2]) if len(sys.argv) > 2 else None,
+            float(sys.argv[3]) if len(sys.argv) > 3 else SENSOR_INTERVAL,
+        )
+    except KeyboardInterrupt:
+        print("Fleet stopped...")
@@ -0,0 +1,54 @@
+# host_inventory.py
+# 미션 컴퓨터의 시스템 정보를 캐시해두는 모듈
+# - OS 이름/버전, CPU 타입처럼 실행 중에 바뀌지 않는 값은 처음 한 번만 조회
+#   (platform.processor()는 리눅스에서 하위 프로세스를 실행하기도 해서 매번 부르면 느림)
+# - CPU 코어 수, 전체 메모리처럼 가볍고 바뀔 수도 있는 값(VM 자원 변경 등)만 매번 다시 조회
+# - 값이 바뀌면 on_change()로 등록한 함수에 알림
+
+import os
+import platform
+
+from P06_mars_mission_computer import load_optional
+
+
+class HostInventory:
+    def __init__(self):
+        self.static = None #처음 get()할 때 채워짐
+        self.last = None #직전에 반환한 정보 (변경 감지용)
+        self.listeners = []
+
+    #변경 알림 받을 함수 등록. callback(changes) 형태로 호출, changes = {항목: (이전 값, 새 값)}
+    def on_change(self, callback):
+        self.listeners.append(callback)
+
+    def _collect_static(self):
+        return {
+            "Operating System": platform.system(),
+            "OS Version": platform.version(),
+            "CPU Type": platform.processor(),
+        }
+
+    def _collect_volatile(self):
+        psutil = load_optional('psutil') #처음 조회할 때 import
+        return {
+            "CPU Cores": os.cpu_count(),
+            "Total Memory (GB)": round(psutil.virtual_memory().total / (1024 ** 3), 2) if psutil else "Unavailable",
+        }
+
+    #바뀌지 않는 값은 캐시에서, 바뀔 수 있는 값만 새로 조회
+    def get(self):
+        if self.static is None:
+            self.static = self._collect_static()
+        info = {**self.static, **self._collect_volatile()}
+
+        if self.last is not None:
+            changes = {key: (self.last.get(key), value) for key, value in info.items() if self.last.get(key) != value}
+            if changes:
+                for callback in self.listeners:
+                    callback(changes)
+        self.last = info
+        return info
+
+    #캐시를 지우고 다음 get()에서 전부 다시 조회 (OS 업데이트 후 등)
+    def refresh(self):
+        self.static = None
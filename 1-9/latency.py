@@ -0,0 +1,109 @@
+# latency.py
+# 파이프라인 단계별 처리 시간을 재는 도구
+# - LatencyHistogram: HDR 히스토그램 방식. 값(ns)을 그대로 저장하지 않고 로그-선형 구간(bucket)의 개수만 셈
+#   2의 거듭제곱 구간마다 2^(SUB_BITS-1)칸으로 나눔 -> 1ns부터 몇 시간까지 상대 오차 1% 미만, 메모리는 고정(몇 KB)
+#   값 하나 기록 = 비트 연산 몇 번 + 배열 칸 하나 증가 (O(1))
+# - StageProfiler: start() 후 단계가 끝날 때마다 mark('단계 이름') -> 직전 mark부터 걸린 시간을 그 단계 히스토그램에 기록
+#   finish()는 start()부터 전체 시간을 'total'에 기록
+
+import time
+from array import array
+
+SUB_BITS = 8 #구간 안을 2^(SUB_BITS-1) = 128칸으로 (상대 오차 < 1/128)
+MAX_VALUE = 3600 * 10 ** 9 #기록할 수 있는 최대값(ns) = 1시간. 더 크면 최대값으로 기록
+
+
+class LatencyHistogram:
+    def __init__(self, max_value=MAX_VALUE, sub_bits=SUB_BITS):
+        self.sub_bits = sub_bits
+        self.half = 1 << (sub_bits - 1)
+        self.max_value = max_value
+        self.counts = array('q', [0] * (self._index(max_value) + 1))
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = 0
+
+    #값 -> 칸 번호. 2^SUB_BITS 미만은 값 그대로, 그 이상은 (몇 번 shift했는지, 앞쪽 SUB_BITS비트)로
+    def _index(self, value):
+        shift = value.bit_length() - self.sub_bits
+        if shift <= 0:
+            return value
+        return shift * self.half + (value >> shift)
+
+    #칸 번호 -> 그 칸에 들어가는 가장 큰 값
+    def _upper(self, index):
+        if index < 2 * self.half:
+            return index
+        shift = index // self.half - 1
+        return (((index - shift * self.half) + 1) << shift) - 1
+
+    def record(self, value):
+        value = min(max(int(value), 0), self.max_value)
+        self.counts[self._index(value)] += 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if value > self.max:
+            self.max = value
+
+    #백분위수 (0~100). 실제 최대값보다 크게 나오지 않도록
+    def percentile(self, p):
+        if not self.count:
+            return None
+        target = max(1, -(-self.count * p // 100)) #p%에 해당하는 순번 (올림)
+        seen = 0
+        for index, n in enumerate(self.counts):
+            if n:
+                seen += n
+                if seen >= target:
+                    return min(self._upper(index), self.max)
+        return self.max
+
+    #다른 히스토그램 합치기 (여러 프로세스/구간 결과를 하나로)
+    def merge(self, other):
+        for index, n in enumerate(other.counts):
+            if n:
+                self.counts[index] += n
+        self.count += other.count
+        self.total += other.total
+        if other.min is not None and (self.min is None or other.min < self.min):
+            self.min = other.min
+        self.max = max(self.max, other.max)
+
+    #{count, mean, p50, p90, p99, p99.9, max} (단위: 마이크로초)
+    def summary(self, digits=2):
+        if not self.count:
+            return {'count': 0}
+        result = {'count': self.count, 'mean': round(self.total / self.count / 1000, digits)}
+        for p in (50, 90, 99, 99.9):
+            result[f'p{p:g}'] = round(self.percentile(p) / 1000, digits)
+        result['max'] = round(self.max / 1000, digits)
+        return result
+
+
+class StageProfiler:
+    def __init__(self):
+        self.histograms = {} #단계 이름 -> LatencyHistogram (처음 mark할 때 생성, 단계 순서 유지)
+        self.started = 0
+        self.last = 0
+
+    def start(self):
+        self.started = self.last = time.perf_counter_ns()
+
+    def mark(self, stage):
+        now = time.perf_counter_ns()
+        histogram = self.histograms.get(stage)
+        if histogram is None:
+            histogram = self.histograms[stage] = LatencyHistogram()
+        histogram.record(now - self.last)
+        self.last = now
+
+    def finish(self):
+        self.last = self.started
+        self.mark('total')
+
+    #{단계: summary()} (단위: 마이크로초)
+    def report(self, digits=2):
+        return {stage: histogram.summary(digits) for stage, histogram in self.histograms.items()}
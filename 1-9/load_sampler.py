@@ -0,0 +1,77 @@
+# load_sampler.py
+# 시스템 부하(CPU/메모리/디스크/네트워크)를 백그라운드 스레드에서 주기적으로 측정해두는 모듈
+# - psutil.cpu_percent(interval=1)처럼 1초씩 기다리지 않고, 지난 측정 이후의 사용률을 interval=None으로 바로 읽음
+# - 측정 결과(snapshot)는 dict 하나로 통째로 바꿔 끼움 -> latest()는 저장된 dict를 바로 반환 (기다림 없음)
+
+import sys
+import time
+import threading
+
+from P06_mars_mission_computer import load_optional
+
+psutil = None #start()할 때 import (부하 정보를 쓰지 않는 프로세스는 psutil을 불러오지 않음)
+
+SAMPLE_RATE = 1.0 #측정 주기(초)
+
+
+class LoadSampler:
+    def __init__(self, interval=SAMPLE_RATE):
+        self.interval = interval
+        self.snapshot = None #가장 최근 측정 결과 (첫 측정 전에는 None)
+        self._stop = threading.Event()
+        self._thread = None
+
+    def start(self):
+        global psutil
+        psutil = load_optional('psutil')
+        if psutil is None:
+            raise ImportError("psutil 모듈 없음.")
+        if self._thread is None:
+            #첫 cpu_percent(interval=None)은 기준점만 잡고 0.0을 반환하므로 미리 한 번 호출
+            psutil.cpu_percent(percpu=True)
+            self._last = (time.monotonic(), psutil.disk_io_counters(), psutil.net_io_counters())
+            self._thread = threading.Thread(target=self._run, daemon=True)
+            self._thread.start()
+        return self
+
+    def _run(self):
+        while not self._stop.wait(self.interval):
+            try:
+                self.snapshot = self._sample()
+            except Exception as e:
+                print("❌ 시스템 부하 측정 오류:", str(e), file=sys.stderr)
+
+    def _sample(self):
+        per_core = psutil.cpu_percent(percpu=True) #지난 호출 이후의 코어별 사용률 (기다리지 않음)
+        now = time.monotonic()
+        disk = psutil.disk_io_counters()
+        net = psutil.net_io_counters()
+        last_time, last_disk, last_net = self._last
+        self._last = (now, disk, net)
+        elapsed = max(now - last_time, 1e-9)
+
+        #누적 카운터의 차이 / 경과 시간 = 초당 값 (디스크/네트워크 정보가 없는 환경이면 None)
+        def rate(current, previous, field):
+            if current is None or previous is None:
+                return None
+            return round((getattr(current, field) - getattr(previous, field)) / elapsed, 1)
+
+        return {
+            "CPU Usage (%)": round(sum(per_core) / len(per_core), 1) if per_core else 0.0,
+            "CPU Usage per Core (%)": per_core,
+            "Memory Usage (%)": psutil.virtual_memory().percent,
+            "Disk Read (B/s)": rate(disk, last_disk, 'read_bytes'),
+            "Disk Write (B/s)": rate(disk, last_disk, 'write_bytes'),
+            "Net Sent (B/s)": rate(net, last_net, 'bytes_sent'),
+            "Net Recv (B/s)": rate(net, last_net, 'bytes_recv'),
+            "Sampled At": time.time(),
+        }
+
+    #가장 최근 측정 결과 (측정 중이어도 기다리지 않음)
+    def latest(self):
+        return self.snapshot
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
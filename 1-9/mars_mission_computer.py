@@ -1,68 +1,179 @@
-import platform
-import os
+import sys
 import json
 import random
 import time
 import threading
 import multiprocessing
+from functools import cached_property
 
-try:
-    import psutil
-except ImportError:
-    print("⚠️ psutil 모듈이 설치되어 있지 않습니다.")
-    psutil = None
+from P06_mars_mission_computer import default_sensor, load_optional, EnvReading, CHANNELS
+from load_sampler import LoadSampler
+from host_inventory import HostInventory
+from alert_engine import AlertEngine
+from anomaly_detector import AnomalyDetector
+from rolling_stats import RollingStats
+from telemetry_codec import TelemetrySink, FORMATS
+#실행 방식마다 필요한 모듈(asyncio, telemetry_store/sqlite3, telemetry_bus, metrics_server, sensor_sources, supervisor)은
+#그 방식의 run_* 함수 안에서 import (spawn으로 시작한 프로세스는 이 파일을 다시 import하므로 쓰지 않는 모듈까지 불러오지 않도록)
 
-from P06_mars_mission_computer import DummySensor
-
-ds = DummySensor()
+SENSOR_INTERVAL = 5 #센서 값 출력 주기(초)
+INFO_INTERVAL = 20 #시스템 정보 출력 주기(초)
+LOAD_INTERVAL = 20 #시스템 부하 출력 주기(초)
+BINARY_OUTPUT = 'telemetry.bin' #binary 출력 형식일 때 프레임을 이어 붙여 저장할 파일
+PSUTIL_WARNING = "⚠️ psutil 모듈이 설치되어 있지 않습니다." #psutil은 부하 정보를 처음 조회할 때 import
 
 class MissionComputer:
-    def __init__(self):
-        self.env_values = ds.get_env()
-        self.sensor = ds
+    def __init__(self, store=None, bus=None, sensor=None, verbose=True, output=None):
+        self.env_values = EnvReading([0.0] * len(CHANNELS)) #가장 최근 측정값 (dict 대신 고정 형식 레코드)
+        if sensor is not None:
+            self.sensor = sensor #read()가 있는 센서 소스면 무엇이든 가능 (sensor_sources.py)
+        self.verbose = verbose #False면 측정값 출력 생략 (기록 데이터 고속 재생용)
+        self.alert_count = 0 #verbose=False일 때 경보/이상은 출력 대신 개수만 셈
+        self.anomaly_count = 0
+        self.output = output if output is not None else TelemetrySink(sys.stdout, 'pretty') #측정값 출력 형식 (telemetry_codec.py)
+        #경보/이상/시스템 정보/부하 같은 측정값이 아닌 출력은 pretty일 때만 stdout, ndjson/binary면 stderr (stdout에는 측정값만)
+        self.log = None if self.output.fmt == 'pretty' else sys.stderr #None이면 print 기본값(sys.stdout)
+        self.store = store #TelemetryStore를 넘기면 측정값을 디스크에도 저장
+        self.bus = bus #TelemetryBus를 넘기면 측정값을 공유 메모리에도 기록 (다른 프로세스에서 읽기용)
+        self.load_sampler = None #부하 정보를 처음 요청할 때 백그라운드 측정 시작
+        self.metrics = None #MetricsServer를 연결하면 측정할 때마다 응답 내용을 갱신
+        self.reporter = None #Supervisor 아래에서 실행되면 처리 개수/지연을 보고 (supervisor.WorkerReporter)
+        self.profiler = None #latency.StageProfiler를 연결하면 측정값마다 단계별 처리 시간 기록 (pipeline_benchmark.py)
+
+    #센서와 측정값 처리 단계는 처음 쓸 때 생성 (시스템 정보/부하만 출력하는 프로세스는 만들지 않음)
+    #cached_property: 처음 한 번만 만들고 그 뒤로는 일반 속성처럼 바로 읽음 (측정값마다 함수 호출 없음)
+    @cached_property
+    def sensor(self):
+        return default_sensor()
+
+    @cached_property
+    def alerts(self):
+        return AlertEngine() #측정값마다 안전 범위 규칙 평가 (알림은 self.alerts.queue에 쌓임)
+
+    @cached_property
+    def anomalies(self):
+        return AnomalyDetector() #채널별 EWMA 기준에서 크게 벗어난 값(센서 이상) 감지
+
+    @cached_property
+    def stats(self):
+        return RollingStats(CHANNELS) #1분/5분/1시간 구간별 평균/최소/최대/분산
+
+    @cached_property
+    def inventory(self):
+        inventory = HostInventory() #바뀌지 않는 시스템 정보는 한 번만 조회해서 캐시
+        inventory.on_change(self.on_info_change)
+        return inventory
+
+    #한 번 실행 (반복/대기는 아래 while 루프나 asyncio 스케줄러가 담당)
+    def read_sensor_once(self):
+        profiler = self.profiler
+        if profiler is None:
+            self.handle_reading(self.sensor.read())
+            return
+        profiler.start()
+        reading = self.sensor.read()
+        profiler.mark('acquire') #센서 값 생성 (예전 set_env + get_env)
+        self.handle_reading(reading, started=True)
+
+    #측정값 하나 처리 (pull: read_sensor_once / push: 센서 소스의 subscribe나 stream()에서 직접 호출)
+    #started: read_sensor_once에서 이미 시간 측정을 시작했으면 True
+    def handle_reading(self, reading, started=False):
+        profiler = self.profiler
+        if profiler is not None and not started:
+            profiler.start()
+        self.env_values = reading
+        if self.store is not None:
+            self.store.append(self.env_values) #큐에 넣기만 하고 바로 반환 (저장은 writer 스레드가 처리)
+        if self.bus is not None:
+            self.bus.publish(self.env_values)
+        self.stats.update(self.env_values)
+        if self.metrics is not None:
+            self.metrics.update(timestamp=self.env_values.timestamp, readings=self.env_values.to_dict(), averages=self.stats.snapshot())
+        if profiler is not None:
+            profiler.mark('process') #저장 큐/공유 메모리/구간 통계
+        if self.verbose:
+            if self.output.fmt == 'pretty':
+                print("📡 Sensor Data:")
+            self.output.write(self.env_values) #반올림/직렬화는 출력 형식이 담당
+            if profiler is not None:
+                profiler.mark('serialize') #반올림 + 직렬화 + 출력
+        if self.alerts.evaluate(self.env_values): #상태가 바뀐 규칙이 있을 때만 바로 출력 (다음 측정까지 기다리지 않음)
+            for alert in self.alerts.drain():
+                self.on_alert(alert)
+        for kind, channel, value, z in self.anomalies.update(self.env_values):
+            self.on_anomaly(kind, channel, value, z)
+        if profiler is not None:
+            profiler.mark('rules') #경보 규칙 + 이상 감지
+            profiler.finish()
+
+    #경보가 켜지거나 꺼졌을 때 호출됨 (verbose=False면 출력 대신 개수만 셈: 기록 재생, 여러 기지 동시 실행)
+    def on_alert(self, alert):
+        if not self.verbose:
+            self.alert_count += 1
+            return
+        icon = "🚨" if alert['state'] == 'ALERT' else "✅"
+        print(f"{icon} [{alert['state']}] {alert['rule']}: {alert['channel']} = {alert['value']:.3f}", file=self.log)
+
+    #EWMA 기준에서 크게 벗어난 값(SPIKE) 또는 센서 값이 조금씩 밀리기 시작/멈춤(DRIFT/DRIFT_CLEAR)
+    def on_anomaly(self, kind, channel, value, z):
+        if not self.verbose:
+            self.anomaly_count += 1
+            return
+        icon = "✅" if kind == 'DRIFT_CLEAR' else "⚠️"
+        print(f"{icon} [{kind}] {channel} = {value:.3f} (z={z:+.1f})", file=self.log)
+
+    def read_info_once(self):
+        try:
+            info = self.inventory.get()
+            print("🖥️ Mission Computer Info:", file=self.log)
+            print(json.dumps(info, indent=4), file=self.log)
+        except Exception as e:
+            print("❌ 시스템 정보 오류:", str(e), file=self.log)
+
+    #시스템 정보가 직전과 달라졌을 때 호출됨 (changes = {항목: (이전 값, 새 값)})
+    def on_info_change(self, changes):
+        print("🔔 시스템 정보 변경:", file=self.log)
+        print(json.dumps(changes, indent=4), file=self.log)
+
+    def read_load_once(self):
+        try:
+            if load_optional('psutil', PSUTIL_WARNING) is None:
+                raise ImportError("psutil 모듈 없음.")
+            if self.load_sampler is None:
+                self.load_sampler = LoadSampler().start()
+            load = self.load_sampler.latest() #백그라운드에서 측정해둔 값을 바로 읽음 (cpu_percent(interval=1)처럼 1초 기다리지 않음)
+            if load is None:
+                print("📊 Mission Computer Load: 측정 준비 중...", file=self.log)
+                return
+            if self.metrics is not None:
+                self.metrics.update(load=load)
+            print("📊 Mission Computer Load:", file=self.log)
+            print(json.dumps(load, indent=4), file=self.log)
+        except Exception as e:
+            print("❌ 시스템 부하 오류:", str(e), file=self.log)
+
+    #감독 프로세스에 진행 상황 보고 (lag: 측정부터 처리 완료까지 걸린 시간, dropped: 저장 큐가 가득 차서 버린 개수)
+    def report_progress(self, lag=0.0):
+        if self.reporter is not None:
+            self.reporter.tick(lag=lag, dropped=self.store.dropped() if self.store is not None else None)
 
     def get_sensor_data(self):
         while True:
-            self.sensor.set_env()
-            self.env_values = self.sensor.get_env()
-            rounded_env_values = {
-                key: round(value, 3) if isinstance(value, (int, float)) else value
-                for key, value in self.env_values.items()
-            }
-            print("📡 Sensor Data:")
-            print(json.dumps(rounded_env_values, indent=4))
-            time.sleep(5) #5초에 한번씩 출력
+            self.read_sensor_once()
+            self.report_progress(time.time() - self.env_values.timestamp)
+            time.sleep(SENSOR_INTERVAL) #5초에 한번씩 출력
 
     def get_mission_computer_info(self):
         while True:
-            try:
-                info = {
-                    "Operating System": platform.system(),
-                    "OS Version": platform.version(),
-                    "CPU Type": platform.processor(),
-                    "CPU Cores": os.cpu_count(),
-                    "Total Memory (GB)": round(psutil.virtual_memory().total / (1024 ** 3), 2) if psutil else "Unavailable"
-                }
-                print("🖥️ Mission Computer Info:")
-                print(json.dumps(info, indent=4))
-            except Exception as e:
-                print("❌ 시스템 정보 오류:", str(e))
-            time.sleep(20) #20초에 한번씩 출력
+            self.read_info_once()
+            self.report_progress()
+            time.sleep(INFO_INTERVAL) #20초에 한번씩 출력
 
     def get_mission_computer_load(self):
         while True:
-            try:
-                if psutil is None:
-                    raise ImportError("psutil 모듈 없음.")
-                load = {
-                    "CPU Usage (%)": psutil.cpu_percent(interval=1),
-                    "Memory Usage (%)": psutil.virtual_memory().percent
-                }
-                print("📊 Mission Computer Load:")
-                print(json.dumps(load, indent=4))
-            except Exception as e:
-                print("❌ 시스템 부하 오류:", str(e))
-            time.sleep(20)  #20초에 한번씩 출력
+            self.read_load_once()
+            self.report_progress()
+            time.sleep(LOAD_INTERVAL)  #20초에 한번씩 출력
 '''
 # ---------- 멀티스레드 실행 ----------
 def run_threads():
@@ -79,40 +190,180 @@ def run_threads():
 '''
     
 # ---------- 멀티프로세스 실행 ----------
-def run_info():
+#reporter: Supervisor가 넘겨주는 진행 상황 보고용 객체 (직접 실행하면 None)
+#Ctrl+C는 모든 프로세스에 같이 전달됨 -> 작업 프로세스는 KeyboardInterrupt를 받으면 traceback 없이 끝내고, 종료 안내는 감독 프로세스가 출력
+def run_info(reporter=None):
     runComputer1 = MissionComputer()
-    runComputer1.get_mission_computer_info()
+    runComputer1.reporter = reporter
+    try:
+        runComputer1.get_mission_computer_info()
+    except KeyboardInterrupt:
+        pass
 
-def run_load():
+def run_load(reporter=None):
     runComputer2 = MissionComputer()
-    runComputer2.get_mission_computer_load()
+    runComputer2.reporter = reporter
+    try:
+        runComputer2.get_mission_computer_load()
+    except KeyboardInterrupt:
+        pass
 
-def run_sensor():
-    runComputer3 = MissionComputer()
-    runComputer3.get_sensor_data()
+def run_sensor(bus_name=None, reporter=None):
+    from telemetry_store import TelemetryStore
+    from telemetry_bus import TelemetryBus, BUS_NAME
+    store = TelemetryStore() #sqlite 연결/스레드는 프로세스마다 따로 만들어야 해서 프로세스 안에서 생성
+    bus = TelemetryBus(bus_name or BUS_NAME) #부모 프로세스가 만든 공유 메모리에 연결
+    runComputer3 = MissionComputer(store=store, bus=bus)
+    runComputer3.reporter = reporter
+    try:
+        runComputer3.get_sensor_data()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        store.close() #남은 값 저장
+        bus.close()
+
+#센서 프로세스가 공유 메모리에 쓴 값을 읽어서 1분마다 평균 출력 (센서를 직접 읽지 않음)
+#공유 메모리는 크기가 정해진 링 버퍼라 읽는 쪽이 느리면 가장 오래된 값부터 덮어써짐 (drop_oldest) -> 건너뛴 개수를 보고
+def run_monitor(bus_name=None, reporter=None):
+    from telemetry_bus import TelemetryBus, BUS_NAME
+    bus = TelemetryBus(bus_name or BUS_NAME)
+    total_dropped = 0
+    try:
+        while True:
+            time.sleep(60)
+            readings, dropped = bus.read_new()
+            total_dropped += dropped
+            if reporter is not None:
+                #lag: 이번에 읽은 값 중 가장 오래된 값이 기다린 시간
+                reporter.tick(count=len(readings), lag=time.time() - readings[0].timestamp if readings else 0.0, dropped=total_dropped)
+            if not readings:
+                continue
+            averaged_values = {
+                key: round(sum(reading.values[index] for reading in readings) / len(readings), 3)
+                for index, key in enumerate(CHANNELS)
+            }
+            print(f"🧮 최근 1분간 평균값 (공유 메모리, {len(readings)}개, 누락 {dropped}개):")
+            print(json.dumps(averaged_values, indent=4))
+    except KeyboardInterrupt:
+        pass
+    finally:
+        bus.close()
 
+#프로세스가 죽거나 멈추면 Supervisor가 다시 시작 (hang_timeout: 주기의 3배 동안 소식이 없으면 멈춘 것으로 봄)
 def run_processes():
-    p1 = multiprocessing.Process(target=run_info)
-    p2 = multiprocessing.Process(target=run_load)
-    p3 = multiprocessing.Process(target=run_sensor)
-    p1.start()
-    p2.start()
-    p3.start()
-    p1.join()
-    p2.join()
-    p3.join()
+    from telemetry_bus import TelemetryBus
+    from supervisor import Supervisor
+    #센서 프로세스가 쓰고 다른 프로세스가 읽을 공유 메모리 (이름은 실행마다 새로 정하고 bus.name으로 자식 프로세스에 전달)
+    bus = TelemetryBus(name=None, create=True)
+    supervisor = Supervisor()
+    supervisor.add('info', run_info, hang_timeout=INFO_INTERVAL * 3)
+    supervisor.add('load', run_load, hang_timeout=LOAD_INTERVAL * 3)
+    supervisor.add('sensor', run_sensor, args=(bus.name,), hang_timeout=SENSOR_INTERVAL * 3)
+    supervisor.add('monitor', run_monitor, args=(bus.name,), hang_timeout=60 * 3)
+    print(f"\n=== [2] 멀티프로세스 실행 ({len(supervisor.workers)}개 인스턴스) ===")
+    try:
+        supervisor.start().run()
+    finally:
+        bus.close() #만든 쪽에서 공유 메모리 삭제
+
+
+# ---------- asyncio 실행 ----------
+#프로세스 3개 대신 이벤트 루프 하나에서 세 작업을 코루틴으로 실행
+#blocking=True인 작업(platform.processor() 등)은 스레드 풀(executor)에서 실행해서 루프를 막지 않음
+async def run_periodic(period, func, blocking=False):
+    import asyncio
+    loop = asyncio.get_running_loop()
+    next_run = loop.time()
+    while True:
+        if blocking:
+            await loop.run_in_executor(None, func)
+        else:
+            func()
+        #"실행 후 period초 쉬기"가 아니라 "시작 시각 + period의 배수"에 맞춰 실행 -> 실행 시간만큼 밀리지 않음(drift-free)
+        next_run += period
+        now = loop.time()
+        if next_run < now: #한 주기 이상 밀렸으면 밀린 횟수만큼 건너뜀 (몰아서 실행하지 않음)
+            next_run += ((now - next_run) // period + 1) * period
+        await asyncio.sleep(next_run - now)
+
+async def run_async(fmt='pretty'):
+    import asyncio
+    from telemetry_store import TelemetryStore
+    from metrics_server import MetricsServer
+    store = TelemetryStore()
+    #binary 프레임은 다른 출력(시스템 정보 등)과 섞이지 않도록 파일로
+    stream = open(BINARY_OUTPUT, 'ab') if fmt == 'binary' else sys.stdout
+    runComputer = MissionComputer(store=store, output=TelemetrySink(stream, fmt))
+    try:
+        runComputer.metrics = await MetricsServer(log=runComputer.log).start() #같은 이벤트 루프에서 HTTP 요청 처리
+    except OSError as e: #포트 사용 중 등 -> HTTP 없이 계속 실행
+        print(f"⚠️ Metrics server를 시작하지 못했습니다 ({e}). HTTP 없이 계속합니다. (포트 변경: MARS_METRICS_PORT)", file=sys.stderr)
+    try:
+        await asyncio.gather(
+            run_periodic(SENSOR_INTERVAL, runComputer.read_sensor_once),
+            run_periodic(INFO_INTERVAL, runComputer.read_info_once, blocking=True),
+            run_periodic(LOAD_INTERVAL, runComputer.read_load_once), #LoadSampler 값을 읽기만 해서 executor가 필요 없음
+        )
+    finally:
+        if runComputer.metrics is not None:
+            await runComputer.metrics.stop()
+        store.close()
+        if fmt == 'binary':
+            stream.close()
+
+
+#기록된 측정값 파일을 speed배속으로 재생해서 파이프라인 전체(저장 제외)를 통과시킴 (speed=None이면 최대 속도)
+async def run_replay(path, speed=None):
+    import sqlite3
+    from sensor_sources import ReplaySource
+    source = ReplaySource(path, speed=speed)
+    runComputer = MissionComputer(sensor=source, verbose=False)
+    count = 0
+    started = time.perf_counter()
+    try:
+        async for reading in source.stream():
+            runComputer.handle_reading(reading)
+            count += 1
+    except FileNotFoundError:
+        print('❌ 파일을 찾을 수 없습니다. 경로를 다시 확인해주세요.')
+        return
+    except (ValueError, sqlite3.Error) as e: #CSV 열/값이 잘못됐거나 readings 테이블이 없는 파일
+        print('❌ 기록 파일을 읽는 도중 오류가 발생했습니다:', str(e))
+        return
+    finally:
+        source.close()
+    elapsed = time.perf_counter() - started
+    print(f"▶ 재생 완료: {count}개 / {elapsed:.2f}초 ({count / elapsed if elapsed else 0:.0f}개/초)")
+    print(f"🚨 경보 {runComputer.alert_count}건 / ⚠️ 이상 {runComputer.anomaly_count}건")
+    print(json.dumps(runComputer.stats.snapshot(), indent=4))
 
 
 # ---------- 메인 ----------
 if __name__ == "__main__":
+    import asyncio #asyncio 실행/재생용 (spawn으로 시작한 작업 프로세스는 이 블록을 실행하지 않음)
     '''
     print("=== [1] 멀티스레드 실행 (1개 인스턴스) ===")
     threading.Thread(target=run_threads).start()
     '''
 
-    print("멀티 프로세스 실행 시작")
-
-    print("\n=== [2] 멀티프로세스 실행 (3개 인스턴스) ===")
-    multiprocessing.set_start_method("spawn")  # Windows 안전용
-    run_processes()
+    if len(sys.argv) > 2 and sys.argv[1] == "replay": #python mars_mission_computer.py replay telemetry.db [배속]
+        try:
+            speed = float(sys.argv[3]) if len(sys.argv) > 3 else None
+        except ValueError:
+            print('❌ 배속은 숫자로 입력해주세요. (예: python mars_mission_computer.py replay telemetry.db 10)')
+        else:
+            asyncio.run(run_replay(sys.argv[2], speed))
+    elif len(sys.argv) > 1 and sys.argv[1] == "process": #python mars_mission_computer.py process
+        print("멀티 프로세스 실행 시작")
+        multiprocessing.set_start_method("spawn")  # Windows 안전용
+        run_processes()
+    else:
+        fmt = sys.argv[1] if len(sys.argv) > 1 and sys.argv[1] in FORMATS else 'pretty' #python mars_mission_computer.py ndjson
+        log = sys.stderr if fmt != 'pretty' else sys.stdout
+        print("\n=== [3] asyncio 실행 (1개 프로세스, 이벤트 루프 1개) ===", file=log)
+        try:
+            asyncio.run(run_async(fmt))
+        except KeyboardInterrupt:
+            print("System stopped...", file=log)
 
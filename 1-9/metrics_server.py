@@ -0,0 +1,147 @@
+# metrics_server.py
+# 미션 컴퓨터 상태를 로컬에서 볼 수 있는 작은 HTTP 서버 (asyncio, 127.0.0.1 전용)
+# - GET /           : 최신 센서 값 + 구간별 평균 + 시스템 부하 (JSON)
+# - GET /metrics    : 같은 내용을 Prometheus 텍스트 형식으로
+# - 응답 내용은 update()가 불릴 때(센서 측정/부하 조회 시점) 미리 만들어둠
+#   -> 요청이 아무리 많이 와도 센서를 읽거나 통계를 다시 계산하지 않고 만들어둔 bytes만 보냄
+# - 포트는 환경 변수 MARS_METRICS_PORT로 바꿀 수 있음 (예: MARS_METRICS_PORT=8080 python mars_mission_computer.py)
+#   값은 start()에서 읽음 (잘못된 값이면 OSError -> 호출하는 쪽에서 HTTP 없이 계속, import할 때 죽지 않음)
+# - NaN/무한대 값: JSON은 null (표준 JSON에는 NaN/Infinity가 없음), Prometheus는 NaN/+Inf/-Inf
+
+import os
+import math
+import json
+import asyncio
+
+HOST = '127.0.0.1' #외부에서 접속하지 못하도록 로컬 주소에만 연결
+PORT_ENV = 'MARS_METRICS_PORT'
+DEFAULT_PORT = 8000
+
+#부하 정보 항목 -> Prometheus 지표 이름
+LOAD_METRICS = {
+    "CPU Usage (%)": 'mars_system_cpu_usage_percent',
+    "Memory Usage (%)": 'mars_system_memory_usage_percent',
+    "Disk Read (B/s)": 'mars_system_disk_read_bytes_per_second',
+    "Disk Write (B/s)": 'mars_system_disk_write_bytes_per_second',
+    "Net Sent (B/s)": 'mars_system_net_sent_bytes_per_second',
+    "Net Recv (B/s)": 'mars_system_net_recv_bytes_per_second',
+}
+
+
+#NaN/무한대를 None으로 바꾼 복사본 (json.dumps가 null로 출력)
+def finite_only(value):
+    if isinstance(value, float):
+        return value if math.isfinite(value) else None
+    if isinstance(value, dict):
+        return {key: finite_only(item) for key, item in value.items()}
+    if isinstance(value, (list, tuple)):
+        return [finite_only(item) for item in value]
+    return value
+
+
+#Prometheus 텍스트 형식의 값 (파이썬 기본 출력 nan/inf는 Prometheus가 읽지 못함)
+def prometheus_value(value):
+    if value != value:
+        return 'NaN'
+    if value == math.inf:
+        return '+Inf'
+    if value == -math.inf:
+        return '-Inf'
+    return str(value)
+
+
+class MetricsServer:
+    #log: 안내 문구를 출력할 스트림 (None이면 sys.stdout. 측정값을 ndjson/binary로 stdout에 내보낼 때는 sys.stderr)
+    #port: None이면 start()에서 환경 변수 MARS_METRICS_PORT (없으면 DEFAULT_PORT)
+    def __init__(self, host=HOST, port=None, log=None):
+        self.host = host
+        self.port = port
+        self.log = log
+        self.state = {'timestamp': None, 'readings': {}, 'averages': {}, 'load': {}}
+        self.json_body = b'{}'
+        self.prometheus_body = b''
+        self.server = None
+        self._render()
+
+    #새 값이 들어올 때만 응답 내용을 다시 만듦 (readings/averages/load 중 바뀐 것만 넘기면 됨)
+    def update(self, **parts):
+        self.state.update(parts)
+        self._render()
+
+    def _render(self):
+        try:
+            self.json_body = json.dumps(self.state, allow_nan=False).encode('utf-8')
+        except ValueError: #NaN/무한대가 있을 때만 복사본을 만들어서 null로
+            self.json_body = json.dumps(finite_only(self.state)).encode('utf-8')
+
+        lines = [
+            '# HELP mars_sensor_value Latest sensor reading',
+            '# TYPE mars_sensor_value gauge',
+        ]
+        for channel, value in self.state['readings'].items():
+            lines.append(f'mars_sensor_value{{channel="{channel}"}} {prometheus_value(value)}')
+
+        lines.append('# HELP mars_sensor_rolling Rolling window statistics of sensor readings')
+        lines.append('# TYPE mars_sensor_rolling gauge')
+        for window, channels in self.state['averages'].items():
+            for channel, stats in channels.items():
+                for stat, value in stats.items():
+                    if value is not None:
+                        lines.append(f'mars_sensor_rolling{{channel="{channel}",window="{window}",stat="{stat}"}} {prometheus_value(value)}')
+
+        if self.state['timestamp'] is not None:
+            lines.append('# TYPE mars_sensor_timestamp_seconds gauge')
+            lines.append(f'mars_sensor_timestamp_seconds {prometheus_value(self.state["timestamp"])}')
+
+        for field, name in LOAD_METRICS.items():
+            value = (self.state['load'] or {}).get(field)
+            if value is not None:
+                lines.append(f'# TYPE {name} gauge')
+                lines.append(f'{name} {prometheus_value(value)}')
+
+        self.prometheus_body = ('\n'.join(lines) + '\n').encode('utf-8')
+
+    #포트를 이미 다른 프로그램이 쓰고 있거나 MARS_METRICS_PORT 값이 잘못됐으면 OSError (호출하는 쪽에서 HTTP 없이 계속할지 결정)
+    async def start(self):
+        if self.port is None:
+            raw = os.environ.get(PORT_ENV, DEFAULT_PORT)
+            try:
+                self.port = int(raw)
+            except ValueError:
+                raise OSError(f"{PORT_ENV} 값이 숫자가 아닙니다: {raw!r}") from None
+            if not 0 <= self.port <= 65535:
+                raise OSError(f"{PORT_ENV} 값이 포트 범위(0~65535)를 벗어났습니다: {self.port}")
+        self.server = await asyncio.start_server(self._handle, self.host, self.port)
+        print(f"🌐 Metrics server: http://{self.host}:{self.port}/ , /metrics", file=self.log)
+        return self
+
+    async def _handle(self, reader, writer):
+        try:
+            request_line = await asyncio.wait_for(reader.readline(), timeout=5)
+            while (await asyncio.wait_for(reader.readline(), timeout=5)) not in (b'\r\n', b'\n', b''): #헤더는 읽고 무시
+                pass
+            parts = request_line.decode('latin-1').split()
+            path = parts[1].split('?')[0] if len(parts) >= 2 else ''
+
+            if len(parts) >= 2 and parts[0] != 'GET':
+                status, content_type, body = '405 Method Not Allowed', 'text/plain', b'method not allowed\n'
+            elif path == '/':
+                status, content_type, body = '200 OK', 'application/json', self.json_body
+            elif path == '/metrics':
+                status, content_type, body = '200 OK', 'text/plain; version=0.0.4', self.prometheus_body
+            else:
+                status, content_type, body = '404 Not Found', 'text/plain', b'not found\n'
+
+            writer.write(
+                f'HTTP/1.1 {status}\r\nContent-Type: {content_type}\r\n'
+                f'Content-Length: {len(body)}\r\nConnection: close\r\n\r\n'.encode('latin-1') + body)
+            await writer.drain()
+        except (asyncio.TimeoutError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    async def stop(self):
+        if self.server is not None:
+            self.server.close()
+            await self.server.wait_closed()
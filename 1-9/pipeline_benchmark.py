@@ -0,0 +1,126 @@
+# pipeline_benchmark.py
+# MissionComputer 센서 파이프라인 벤치마크
+# - 측정 속도(초당 rate개)를 두 배씩 올리면서 read_sensor_once()를 정해진 시각마다 실행
+#   단계별 처리 시간(acquire -> process -> serialize -> rules -> total)을 latency.StageProfiler로 기록해서 p50/p99 출력
+# - 정해진 시각보다 늦게 시작한 정도(지연)도 같이 기록
+# - 목표 속도의 SUSTAINED(98%) 이상을 처리하고 시작 지연 p99가 측정 주기(10**9/rate ns)의 MAX_LATENESS배 이하이면
+#   감당 가능으로 보고, 감당 가능한 최대 속도를 출력 (평균 속도만 맞추고 측정 시각이 계속 밀리는 경우 제외)
+# - 예전 방식(set_env -> get_env -> dict 반올림 -> json.dumps)의 단계별 시간도 따로 측정해서 비교
+# - 출력은 /dev/null로 보냄 (화면 출력 속도가 아니라 파이프라인 자체 속도를 재기 위해)
+#
+# 사용법: python pipeline_benchmark.py [--format ndjson] [--start 100] [--max-rate 100000] [--duration 2]
+
+import os
+import json
+import time
+import argparse
+import contextlib
+
+from P06_mars_mission_computer import DummySensor
+from latency import StageProfiler, LatencyHistogram
+from telemetry_codec import TelemetrySink, FORMATS
+from mars_mission_computer import MissionComputer
+
+SUSTAINED = 0.98
+MAX_LATENESS = 1.0 #시작 지연 p99 허용 한도 (측정 주기 배수)
+LEGACY_SAMPLES = 20000
+
+
+#벤치마크용: 경보/이상 감지는 계산만 하고 출력하지 않음
+class BenchComputer(MissionComputer):
+    def on_alert(self, alert):
+        pass
+
+    def on_anomaly(self, kind, channel, value, z):
+        pass
+
+
+#rate개/초로 duration초 동안 실행 -> (실제 처리 속도, 단계별 결과, 지연 히스토그램)
+def run_rate(rate, duration, fmt):
+    with open(os.devnull, 'wb' if fmt == 'binary' else 'w') as sink, open(os.devnull, 'w') as devnull:
+        computer = BenchComputer(output=TelemetrySink(sink, fmt))
+        lateness = LatencyHistogram()
+        period = 10 ** 9 / rate
+        done = 0
+        with contextlib.redirect_stdout(devnull): #'📡 Sensor Data:' 같은 print도 화면에 나오지 않도록
+            computer.read_sensor_once() #센서/규칙/통계를 처음 만드는 시간이 첫 측정의 지연에 들어가지 않도록 미리 한 번 실행
+            computer.profiler = StageProfiler()
+            start = time.perf_counter_ns()
+            deadline = start + int(duration * 10 ** 9)
+            while True:
+                scheduled = start + int(done * period)
+                now = time.perf_counter_ns()
+                if scheduled >= deadline or now >= deadline:
+                    break
+                if scheduled > now:
+                    wait = (scheduled - now) / 10 ** 9
+                    if wait > 0.002: #sleep은 오차가 커서 남은 시간이 짧으면 바쁜 대기
+                        time.sleep(wait - 0.001)
+                    while time.perf_counter_ns() < scheduled:
+                        pass
+                    now = scheduled
+                lateness.record(now - scheduled)
+                computer.read_sensor_once()
+                done += 1
+            elapsed = (time.perf_counter_ns() - start) / 10 ** 9
+    return done / elapsed, computer.profiler.report(), lateness
+
+
+#예전 방식 한 사이클: set_env -> get_env -> 소수점 3자리 반올림 dict -> json.dumps
+def run_legacy(n=LEGACY_SAMPLES):
+    sensor = DummySensor()
+    profiler = StageProfiler()
+    for _ in range(n):
+        profiler.start()
+        sensor.set_env()
+        profiler.mark('set_env')
+        values = sensor.get_env()
+        profiler.mark('get_env')
+        rounded = {key: round(value, 3) for key, value in values.items()}
+        profiler.mark('round')
+        json.dumps(rounded, indent=4)
+        profiler.mark('serialize')
+        profiler.finish()
+    return profiler.report()
+
+
+def benchmark(fmt='pretty', start_rate=100, max_rate=100000, duration=2.0):
+    print(f"=== 파이프라인 벤치마크 (출력 형식: {fmt}, 단계마다 {duration}초) ===")
+    best = None
+    rate = start_rate
+    while rate <= max_rate:
+        achieved, stages, lateness = run_rate(rate, duration, fmt)
+        ok = achieved >= rate * SUSTAINED and lateness.percentile(99) <= MAX_LATENESS * 10 ** 9 / rate
+        total = stages.get('total', {})
+        print(f"{'✅' if ok else '❌'} 목표 {rate:>7,}/초 -> 처리 {achieved:>9,.0f}/초 | "
+              f"total p50 {total.get('p50')}us p99 {total.get('p99')}us | "
+              f"시작 지연 p99 {lateness.percentile(99) / 1000:.1f}us")
+        if not ok:
+            break
+        best = (rate, stages)
+        rate *= 2
+
+    if best is None:
+        print(f"❌ {start_rate}/초도 감당하지 못했습니다.")
+    else:
+        print(f"🏁 감당 가능한 최대 측정 속도: {best[0]:,}/초 (2배씩 올려서 확인)")
+        print("⏱️ 단계별 처리 시간 (마이크로초):")
+        print(json.dumps(best[1], indent=4))
+
+    print("⏱️ 예전 방식 set_env -> get_env -> 반올림 -> json.dumps (마이크로초):")
+    print(json.dumps(run_legacy(), indent=4))
+    return best[0] if best else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description='센서 파이프라인 단계별 처리 시간과 감당 가능한 최대 측정 속도를 측정합니다.')
+    parser.add_argument('--format', choices=FORMATS, default='pretty', help='측정값 출력 형식 (기본: pretty)')
+    parser.add_argument('--start', type=int, default=100, help='시작 속도(개/초, 기본: 100)')
+    parser.add_argument('--max-rate', type=int, default=100000, help='최대 속도(개/초, 기본: 100000)')
+    parser.add_argument('--duration', type=float, default=2.0, help='속도 단계마다 실행할 시간(초, 기본: 2)')
+    args = parser.parse_args()
+    benchmark(args.format, args.start, args.max_rate, args.duration)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,6 @@
+# rolling_stats.py
+# 구간별(1분/5분/1시간) 이동 통계 연결 파일
+# 실제 코드는 저장소 최상위 mars_telemetry 패키지(mars_telemetry/rolling_stats.py) 한 곳에만 있음
+
+import telemetry_path  # noqa: F401 (mars_telemetry를 import할 수 있도록 경로 설정)
+from mars_telemetry.rolling_stats import SAMPLE_INTERVAL, STAT_WINDOWS, RingBuffer, RollingWindow, RollingStats
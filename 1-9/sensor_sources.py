@@ -0,0 +1,113 @@
+# sensor_sources.py
+# MissionComputer가 측정값을 받아오는 곳(센서 소스)을 바꿔 끼울 수 있게 하는 모듈
+# - pull: read()를 부르면 측정값(EnvReading) 하나를 돌려줌 (더 없으면 None)
+# - push: subscribe(callback)로 등록한 함수에 값이 올 때마다 전달 / async for reading in source.stream(): ...
+# - DummySource: 기존 DummySensor를 감싼 소스
+# - ReplaySource: 기록된 측정값 파일(CSV 또는 telemetry.db)을 원래 간격의 N배 속도로 다시 재생
+#   (speed=None이면 기다리지 않고 최대 속도로 -> 기록 데이터로 파이프라인 부하 테스트)
+
+import abc
+import csv
+import asyncio
+
+import telemetry_path  # noqa: F401 (mars_telemetry를 import할 수 있도록 경로 설정)
+from P06_mars_mission_computer import DummySensor, CHANNELS
+from mars_telemetry.history import iter_history #1-7 replay_backfill.py와 같은 기록 파일 읽기 코드
+
+YIELD_EVERY = 1000 #기다림 없이 재생할 때 이벤트 루프에 양보하는 간격(개수)
+
+
+class SensorSource(abc.ABC):
+    def __init__(self):
+        self.callbacks = []
+
+    #측정값 하나 (더 이상 값이 없으면 None) -> 소스마다 반드시 구현 (구현하지 않으면 인스턴스를 만들 때 TypeError)
+    @abc.abstractmethod
+    def read(self):
+        pass
+
+    def subscribe(self, callback):
+        self.callbacks.append(callback)
+
+    def _emit(self, reading):
+        for callback in self.callbacks:
+            callback(reading)
+
+    #기본 push 방식: interval초마다 read() (pull 소스도 push처럼 사용 가능)
+    async def stream(self, interval=None):
+        loop = asyncio.get_running_loop()
+        next_run = loop.time()
+        count = 0
+        while True:
+            reading = self.read()
+            if reading is None:
+                return
+            self._emit(reading)
+            yield reading
+            count += 1
+            if interval:
+                next_run += interval
+                await asyncio.sleep(max(0.0, next_run - loop.time()))
+            elif count % YIELD_EVERY == 0: #쉬지 않고 읽을 때도 가끔은 다른 코루틴이 실행될 기회를 줌
+                await asyncio.sleep(0)
+
+    def close(self):
+        pass
+
+
+class DummySource(SensorSource):
+    def __init__(self, sensor=None):
+        super().__init__()
+        self.sensor = sensor if sensor is not None else DummySensor()
+
+    def read(self):
+        return self.sensor.read()
+
+
+#기록 파일 한 줄 = 측정 시각 + 채널 값 6개
+def save_csv(readings, path):
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(['timestamp', *CHANNELS])
+        for reading in readings:
+            writer.writerow([reading.timestamp, *reading.values])
+
+
+class ReplaySource(SensorSource):
+    #path: .csv(save_csv 형식) 또는 TelemetryStore의 .db 파일 / speed: 재생 배속 (None이면 최대 속도)
+    def __init__(self, path, speed=1.0):
+        super().__init__()
+        self.path = path
+        self.speed = speed
+        self._records = iter_history(path) #파일 전체를 메모리에 올리지 않고 한 줄씩 읽음
+
+    #pull: 기다리지 않고 다음 값 (기록된 측정 시각은 그대로 유지)
+    def read(self):
+        return next(self._records, None)
+
+    #push: 기록된 측정 간격 / speed 만큼 기다리며 재생
+    async def stream(self, interval=None):
+        loop = asyncio.get_running_loop()
+        start_wall = loop.time()
+        start_ts = None
+        count = 0
+        while True:
+            reading = self.read()
+            if reading is None:
+                return
+            if self.speed:
+                if start_ts is None:
+                    start_ts = reading.timestamp
+                #시작 시점 기준으로 계산해서 sleep 오차가 쌓이지 않도록
+                delay = start_wall + (reading.timestamp - start_ts) / self.speed - loop.time()
+                if delay > 0:
+                    await asyncio.sleep(delay)
+            else:
+                count += 1
+                if count % YIELD_EVERY == 0:
+                    await asyncio.sleep(0)
+            self._emit(reading)
+            yield reading
+
+    def close(self):
+        self._records.close() #generator를 닫으면 파일/DB 연결도 닫힘
@@ -0,0 +1,147 @@
+# supervisor.py
+# 미션 컴퓨터 작업 프로세스들을 띄우고 지켜보는 감독(supervisor)
+# - 프로세스가 죽으면(예외, 강제 종료 등) 다시 시작. 연속으로 죽으면 1초, 2초, 4초 ... 최대 BACKOFF_MAX초까지 기다렸다가 재시작
+#   (STABLE_AFTER초 이상 잘 돌다가 죽었으면 기다리는 시간을 처음부터 다시)
+# - 작업마다 heartbeat(마지막으로 일을 끝낸 시각)를 확인 -> hang_timeout초 동안 소식이 없으면 멈춘 것으로 보고 종료 후 재시작
+# - 작업 프로세스는 WorkerReporter.tick()으로 처리 개수/지연(lag)/버린 개수를 공유 메모리 배열에 기록 (pipe/queue 없이)
+# - 감독은 REPORT_INTERVAL초마다 작업별 처리량(개/분), 지연, 버린 개수, 재시작 횟수를 출력
+
+import json
+import time
+import multiprocessing
+
+BACKOFF_BASE = 1.0 #첫 재시작 대기 시간(초)
+BACKOFF_MAX = 60.0
+STABLE_AFTER = 60.0 #이만큼 돌았으면 정상으로 보고 재시작 대기 시간 초기화
+REPORT_INTERVAL = 60.0
+CHECK_INTERVAL = 0.5 #프로세스 상태 확인 주기(초)
+
+FIELDS = 4 #작업 하나당 [처리 개수, 지연(초), 버린 개수, heartbeat 시각]
+
+
+#작업 프로세스 안에서 자기 칸에만 기록 (쓰는 쪽이 하나뿐이라 잠금 없이 사용)
+class WorkerReporter:
+    def __init__(self, counters, slot):
+        self.counters = counters
+        self.base = slot * FIELDS
+
+    #일 하나 끝낼 때마다 호출. lag: 작업이 정의하는 지연(초), dropped: 지금까지 버린 개수(누적)
+    def tick(self, count=1, lag=0.0, dropped=None):
+        base = self.base
+        self.counters[base] += count
+        self.counters[base + 1] = lag
+        if dropped is not None:
+            self.counters[base + 2] = dropped
+        self.counters[base + 3] = time.time()
+
+
+class Worker:
+    def __init__(self, name, target, args=(), hang_timeout=None):
+        self.name = name
+        self.target = target
+        self.args = args
+        self.hang_timeout = hang_timeout #None이면 멈춤 감지 안 함
+        self.process = None
+        self.started = 0.0
+        self.failures = 0 #연속으로 죽은 횟수 (대기 시간 계산용)
+        self.restarts = 0
+        self.restart_at = None #재시작 예정 시각 (기다리는 중일 때)
+        self.last_count = 0.0 #처리량 계산용 직전 보고 시점의 처리 개수
+
+
+class Supervisor:
+    def __init__(self, report_interval=REPORT_INTERVAL):
+        self.workers = []
+        self.counters = None
+        self.report_interval = report_interval
+
+    def add(self, name, target, args=(), hang_timeout=None):
+        self.workers.append(Worker(name, target, args, hang_timeout))
+
+    def _spawn(self, slot):
+        worker = self.workers[slot]
+        base = slot * FIELDS
+        self.counters[base + 3] = time.time() #시작 직후는 heartbeat가 없으니 시작 시각부터 계산
+        #target(*args, reporter=...) 형태로 호출
+        worker.process = multiprocessing.Process(
+            target=worker.target, args=worker.args,
+            kwargs={'reporter': WorkerReporter(self.counters, slot)}, name=worker.name, daemon=True)
+        worker.process.start()
+        worker.started = time.monotonic()
+        worker.restart_at = None
+
+    def start(self):
+        self.counters = multiprocessing.RawArray('d', len(self.workers) * FIELDS) #모든 작업이 같이 쓰는 공유 메모리 배열
+        for slot in range(len(self.workers)):
+            self._spawn(slot)
+        return self
+
+    #죽은 프로세스는 대기 후 재시작, 멈춘 프로세스는 종료 (다음 확인 때 재시작)
+    def check(self):
+        now = time.monotonic()
+        for slot, worker in enumerate(self.workers):
+            if worker.restart_at is not None:
+                if now >= worker.restart_at:
+                    worker.restarts += 1
+                    print(f"🔁 {worker.name} 재시작 ({worker.restarts}번째)")
+                    self._spawn(slot)
+                continue
+
+            process = worker.process
+            if process.is_alive():
+                heartbeat_age = time.time() - self.counters[slot * FIELDS + 3]
+                if worker.hang_timeout is not None and heartbeat_age > worker.hang_timeout:
+                    print(f"⏱️ {worker.name} 응답 없음 ({heartbeat_age:.0f}초) -> 강제 종료")
+                    process.terminate()
+                    process.join()
+                else:
+                    continue
+
+            if now - worker.started >= STABLE_AFTER:
+                worker.failures = 0
+            delay = min(BACKOFF_MAX, BACKOFF_BASE * 2 ** worker.failures)
+            worker.failures += 1
+            worker.restart_at = now + delay
+            print(f"💥 {worker.name} 종료됨 (exit code {process.exitcode}) -> {delay:.0f}초 뒤 재시작")
+
+    #작업별 {pid, 처리량(개/분), 지연(초), 버린 개수, heartbeat 경과(초), 재시작 횟수}
+    def report(self, elapsed):
+        result = {}
+        for slot, worker in enumerate(self.workers):
+            count, lag, dropped, heartbeat = self.counters[slot * FIELDS:(slot + 1) * FIELDS]
+            result[worker.name] = {
+                "pid": worker.process.pid if worker.restart_at is None else None,
+                "throughput (/min)": round((count - worker.last_count) * 60 / elapsed, 2) if elapsed > 0 else 0.0,
+                "lag (s)": round(lag, 3),
+                "dropped": int(dropped),
+                "heartbeat age (s)": round(time.time() - heartbeat, 1),
+                "restarts": worker.restarts,
+            }
+            worker.last_count = count
+        return result
+
+    #멈출 때까지 감시 (Ctrl+C 등으로 빠져나오면 모든 작업 종료)
+    #Ctrl+C는 작업 프로세스에도 같이 전달됨 -> 작업 쪽 실행 함수도 KeyboardInterrupt를 받아서 조용히 끝나야 함
+    def run(self):
+        last_report = time.monotonic()
+        try:
+            while True:
+                time.sleep(CHECK_INTERVAL)
+                self.check()
+                now = time.monotonic()
+                if now - last_report >= self.report_interval:
+                    print("📈 Worker Report:")
+                    print(json.dumps(self.report(now - last_report), indent=4))
+                    last_report = now
+        except KeyboardInterrupt:
+            print("System stopped...")
+        finally:
+            self.stop()
+
+    def stop(self):
+        for worker in self.workers:
+            if worker.process is not None and worker.process.is_alive():
+                worker.process.terminate()
+        for worker in self.workers:
+            if worker.process is not None:
+                worker.process.join()
@@ -0,0 +1,97 @@
+# telemetry_bus.py
+# 프로세스끼리 센서 측정값을 공유하는 공유 메모리 링 버퍼
+# - 센서 프로세스 1개가 쓰고(publish), 다른 프로세스들은 같은 메모리를 직접 읽음 (pipe/queue로 pickle해서 보내지 않음)
+# - 메모리 구조 (전부 float64):
+#     [0]                    : 지금까지 쓴 레코드 개수
+#     [1 + slot * RECORD ..] : 슬롯마다 [번호(seq), 측정 시각, 채널 값 6개]
+# - 쓰는 중인 슬롯은 번호를 -1로 표시 -> 읽는 쪽은 읽기 전/후 번호가 같을 때만 사용 (중간에 덮어써진 값 방지)
+
+from multiprocessing import shared_memory
+
+from P06_mars_mission_computer import EnvReading, CHANNELS
+
+BUS_NAME = 'mars_telemetry_bus'
+BUS_CAPACITY = 1024 #슬롯 개수 (가장 최근 1024개까지 보관)
+RECORD = 2 + len(CHANNELS) #슬롯 하나의 float 개수
+ITEM_SIZE = 8 #float64
+
+
+class TelemetryBus:
+    #create=True: 센서(쓰는) 쪽에서 새로 생성 / False: 이미 만들어진 메모리에 연결
+    #create=True, name=None: 겹치지 않는 이름을 SharedMemory가 정함 (실행 중인 다른 launcher나 남아 있는 메모리와 충돌 방지)
+    #  -> 실제 이름은 self.name으로 읽어서 연결하는 쪽에 넘김
+    def __init__(self, name=BUS_NAME, capacity=BUS_CAPACITY, create=False):
+        size = (1 + capacity * RECORD) * ITEM_SIZE
+        if create:
+            self.shm = shared_memory.SharedMemory(name=name, create=True, size=size)
+        else:
+            #run_processes()의 자식 프로세스는 부모와 같은 resource_tracker를 같이 쓰므로 연결만 해도 따로 지워지지 않음
+            #(지우는 건 만든 쪽 close()에서 담당). Python 3.13+는 track=False로 추적 자체를 안 함
+            try:
+                self.shm = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                self.shm = shared_memory.SharedMemory(name=name)
+        self.name = self.shm.name
+        self.owner = create
+        self.capacity = (self.shm.size // ITEM_SIZE - 1) // RECORD #이미 있는 메모리에 연결할 때는 실제 크기 기준
+        self.buf = self.shm.buf.cast('d') #bytes -> float64 배열처럼 사용
+        if create:
+            self.buf[0] = 0.0
+        self.cursor = int(self.buf[0]) #read_new()가 다음에 읽을 번호 (연결한 시점 이후 값부터)
+
+    def _base(self, seq):
+        return 1 + (seq % self.capacity) * RECORD
+
+    #센서 프로세스에서만 호출
+    def publish(self, reading):
+        seq = int(self.buf[0])
+        base = self._base(seq)
+        self.buf[base] = -1.0 #쓰는 중 표시
+        self.buf[base + 1] = reading.timestamp
+        self.buf[base + 2:base + RECORD] = reading.values
+        self.buf[base] = float(seq) #다 쓴 뒤에 번호 기록
+        self.buf[0] = float(seq + 1)
+
+    #번호가 seq인 레코드 (이미 덮어써졌거나 쓰는 중이면 None)
+    def _read(self, seq):
+        base = self._base(seq)
+        if self.buf[base] != seq:
+            return None
+        timestamp = self.buf[base + 1]
+        values = self.buf[base + 2:base + RECORD].tolist()
+        if self.buf[base] != seq: #읽는 동안 덮어써짐
+            return None
+        return EnvReading(values, timestamp=timestamp)
+
+    #가장 최근 값 (아직 아무것도 없으면 None)
+    def latest(self):
+        for _ in range(3): #쓰는 중이었으면 몇 번 다시 시도
+            count = int(self.buf[0])
+            if count == 0:
+                return None
+            reading = self._read(count - 1)
+            if reading is not None:
+                return reading
+        return None
+
+    #마지막으로 읽은 뒤 새로 들어온 값들 (읽는 쪽이 너무 느려서 덮어써진 값은 건너뜀)
+    #반환값: (측정값 리스트, 건너뛴 개수)
+    def read_new(self):
+        count = int(self.buf[0])
+        oldest = max(self.cursor, count - self.capacity + 1) #쓰는 중인 슬롯 하나는 여유로 둠
+        dropped = oldest - self.cursor
+        readings = []
+        for seq in range(oldest, count):
+            reading = self._read(seq)
+            if reading is None:
+                dropped += 1
+            else:
+                readings.append(reading)
+        self.cursor = count
+        return readings, dropped
+
+    def close(self):
+        self.buf.release() #cast로 만든 memoryview를 먼저 해제해야 close 가능
+        self.shm.close()
+        if self.owner:
+            self.shm.unlink() #만든 쪽이 끝날 때 공유 메모리 삭제
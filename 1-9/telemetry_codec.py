@@ -0,0 +1,97 @@
+# telemetry_codec.py
+# 측정값(EnvReading) 출력/전송 형식
+# - 'pretty' : 기존처럼 json.dumps(indent=4) (사람이 보는 화면용)
+# - 'ndjson' : 한 줄에 JSON 하나, 들여쓰기 없음 (로그 수집/파이프용)
+#              dict를 만들지 않고 미리 만든 형식 문자열에 값을 넣음. 반올림은 '%.3f' 형식 지정으로 C 수준에서 한 번에 처리
+#              nan/inf는 JSON에 없는 값이라 null로 출력
+# - 'binary' : 고정 크기 프레임 = 헤더(매직 b'MT', 버전, 채널 수, 측정 시각 float64) + 채널 값 float32 x 6 -> 36바이트
+# 출력 대상(sink)마다 형식을 따로 고를 수 있음
+# 파이프/파일로 보내면 stdout도 블록 단위(8KB)로 버퍼링됨 -> flush_every개 쓸 때마다 flush해서 바로 전달 (기본: 매번)
+
+import json
+import math
+import struct
+
+from P06_mars_mission_computer import EnvReading, CHANNELS
+
+FRAME_MAGIC = b'MT'
+FRAME_VERSION = 1
+FRAME = struct.Struct(f'<2sBBd{len(CHANNELS)}f') #<: 리틀 엔디언, 패딩 없음
+FORMATS = ('pretty', 'ndjson', 'binary')
+
+
+def encode_frame(reading):
+    return FRAME.pack(FRAME_MAGIC, FRAME_VERSION, len(CHANNELS), reading.timestamp, *reading.values)
+
+
+def decode_frame(data, offset=0):
+    magic, version, channels, timestamp, *values = FRAME.unpack_from(data, offset)
+    if magic != FRAME_MAGIC or version != FRAME_VERSION or channels != len(CHANNELS):
+        raise ValueError('알 수 없는 텔레메트리 프레임입니다.')
+    return EnvReading(values, timestamp=timestamp)
+
+
+#여러 프레임이 이어 붙은 bytes -> EnvReading들
+def iter_frames(data):
+    for offset in range(0, len(data) - FRAME.size + 1, FRAME.size):
+        yield decode_frame(data, offset)
+
+
+#{"timestamp":%.3f,"채널":%.3f,...} 형식 문자열을 한 번만 만들어 둠
+def ndjson_template(digits=3):
+    fields = ','.join(f'"{key}":%.{digits}f' for key in ('timestamp',) + CHANNELS)
+    return '{' + fields + '}\n'
+
+
+#nan/inf가 섞인 측정값 한 줄 (값마다 확인해야 해서 느리지만 드물게만 사용)
+def ndjson_line(reading, digits=3):
+    fields = zip(('timestamp',) + CHANNELS, (reading.timestamp, *reading.values))
+    return '{' + ','.join(f'"{key}":' + (f'{value:.{digits}f}' if math.isfinite(value) else 'null') for key, value in fields) + '}\n'
+
+
+class TelemetrySink:
+    #stream: 텍스트 형식이면 sys.stdout 같은 텍스트 스트림, binary면 sys.stdout.buffer/파일('wb') 같은 바이트 스트림
+    #flush_every: 몇 개 쓸 때마다 flush할지 (0이면 flush하지 않고 스트림 버퍼에 맡김)
+    def __init__(self, stream, fmt='pretty', digits=3, flush_every=1):
+        if fmt not in FORMATS:
+            raise ValueError(f'지원하지 않는 출력 형식입니다: {fmt}')
+        self.stream = stream
+        self.fmt = fmt
+        self.digits = digits
+        self.template = ndjson_template(digits)
+        self.flush_every = flush_every
+        self.unflushed = 0 #마지막 flush 뒤로 쓴 개수
+
+    #ndjson 한 줄. 값이 모두 유한하면 합도 유한 -> 평소에는 합 한 번만 확인하고 형식 문자열 사용
+    def _ndjson(self, reading):
+        if math.isfinite(reading.timestamp + sum(reading.values)):
+            return self.template % (reading.timestamp, *reading.values)
+        return ndjson_line(reading, self.digits)
+
+    def write(self, reading):
+        if self.fmt == 'ndjson':
+            self.stream.write(self._ndjson(reading))
+        elif self.fmt == 'binary':
+            self.stream.write(encode_frame(reading))
+        else:
+            self.stream.write(json.dumps(reading.to_dict(self.digits), indent=4) + '\n')
+        if self.flush_every:
+            self.unflushed += 1
+            if self.unflushed >= self.flush_every:
+                self.flush()
+
+    #여러 개를 한 번에 (write 호출 1번, flush도 묶음 끝에서 한 번)
+    def write_batch(self, readings):
+        if self.fmt == 'ndjson':
+            line = self._ndjson
+            self.stream.write(''.join(line(reading) for reading in readings))
+        elif self.fmt == 'binary':
+            self.stream.write(b''.join(encode_frame(reading) for reading in readings))
+        else:
+            self.stream.write(''.join(json.dumps(reading.to_dict(self.digits), indent=4) + '\n' for reading in readings))
+        if self.flush_every:
+            self.flush()
+
+    def flush(self):
+        self.stream.flush()
+        self.unflushed = 0
@@ -0,0 +1,10 @@
+# telemetry_path.py
+# 저장소 최상위 폴더(mars_telemetry 패키지가 있는 곳)를 sys.path에 추가
+# 이 폴더의 파일은 mars_telemetry를 import하기 전에 `import telemetry_path`만 하면 됨 (경로 설정은 이 파일 한 곳에서만)
+
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if ROOT not in sys.path:
+    sys.path.insert(0, ROOT)
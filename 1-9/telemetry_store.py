@@ -0,0 +1,237 @@
+# telemetry_store.py
+# 센서 측정값(EnvReading)을 디스크에 계속 쌓아두는 시계열 저장소
+# - SQLite(표준 라이브러리) + WAL 모드: 쓰는 중에도 다른 연결에서 읽기 가능
+# - append()는 큐에 넣기만 하고 바로 반환 -> 5초 수집 루프가 디스크 쓰기 때문에 멈추지 않음
+#   큐는 max_pending개까지만 (디스크가 멈춰도 메모리가 끝없이 늘지 않음). 가득 차면 policy대로 처리 (bounded_queue.py)
+# - 별도 스레드가 큐에 쌓인 값을 batch_size개씩 모아서 한 번에 저장 (트랜잭션 1번)
+# - ts(측정 시각)에 인덱스가 있어서 기간 조회가 빠름
+# - writer 스레드가 주기적으로 원본(5초) -> 1분 -> 1시간 -> 1일 요약(평균/최소/최대/개수)을 만들고
+#   단계별 보관 기간이 지난 데이터는 지움 (이미 상위 단계로 요약된 데이터만)
+
+import sys
+import queue
+import sqlite3
+import threading
+import time
+
+from P06_mars_mission_computer import EnvReading, CHANNELS
+from bounded_queue import BoundedQueue
+
+DB_FILE = 'telemetry.db'
+SAMPLE_INTERVAL = 5 #원본 데이터 간격(초)
+MAX_PENDING = 100000 #저장 대기 최대 개수 (5초 간격이면 약 5.8일치)
+
+#(요약 단계 이름, 구간 길이(초), 요약할 원본 단계). 앞 단계가 만들어져야 다음 단계를 만들 수 있음
+ROLLUP_TIERS = [
+    ('1min', 60, 'raw'),
+    ('1hour', 3600, '1min'),
+    ('1day', 86400, '1hour'),
+]
+
+DAY = 86400
+#단계별 보관 기간(초). None이면 지우지 않음
+RETENTION = {
+    'raw': 7 * DAY,
+    '1min': 30 * DAY,
+    '1hour': 365 * DAY,
+    '1day': None,
+}
+
+_STOP = object() #writer 스레드 종료 신호
+
+
+class TelemetryStore:
+    def __init__(self, path=DB_FILE, batch_size=64, flush_interval=1.0, retention=RETENTION, compact_interval=60.0,
+                 max_pending=MAX_PENDING, policy='drop_oldest'):
+        self.path = path
+        self.batch_size = batch_size #한 번에 저장할 최대 개수
+        self.flush_interval = flush_interval #값이 적게 들어와도 이 시간(초)마다 한 번은 저장
+        self.queue = BoundedQueue(max_pending, policy) #저장이 밀리면 가장 오래된 값부터 버림 (기본)
+        self.columns = ', '.join(f'"{key}"' for key in CHANNELS)
+        self.retention = retention
+        self.compact_interval = compact_interval #요약/정리 주기(초)
+
+        #테이블은 미리 만들어두고, 쓰기 연결은 writer 스레드 안에서 따로 생성 (sqlite 연결은 만든 스레드에서만 사용)
+        column_defs = ', '.join(f'"{key}" REAL' for key in CHANNELS)
+        conn = self._connect()
+        with conn:
+            conn.execute(f'CREATE TABLE IF NOT EXISTS readings (ts REAL NOT NULL, {column_defs})')
+            conn.execute('CREATE INDEX IF NOT EXISTS readings_ts ON readings (ts)')
+            #요약 테이블: 구간 시작 시각(bucket)마다 한 줄, 채널마다 평균/최소/최대
+            rollup_defs = ', '.join(f'"{key}_{stat}" REAL' for key in CHANNELS for stat in ('mean', 'min', 'max'))
+            for name, _, _ in ROLLUP_TIERS:
+                conn.execute(f'CREATE TABLE IF NOT EXISTS rollup_{name} (bucket REAL PRIMARY KEY, count INTEGER NOT NULL, {rollup_defs})')
+            #단계별로 어디까지 요약했는지 (이 시각 이전 구간은 요약 완료)
+            conn.execute('CREATE TABLE IF NOT EXISTS rollup_state (tier TEXT PRIMARY KEY, watermark REAL NOT NULL)')
+        conn.close()
+
+        self.writer = threading.Thread(target=self._write_loop, daemon=True)
+        self.writer.start()
+
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=10)
+        conn.execute('PRAGMA journal_mode=WAL') #쓰기와 읽기가 서로를 막지 않음
+        conn.execute('PRAGMA synchronous=NORMAL') #WAL에서는 NORMAL로도 DB가 깨지지 않음 (마지막 몇 개만 잃을 수 있음)
+        return conn
+
+    #측정값 하나 저장 요청 (바로 반환)
+    def append(self, reading):
+        self.queue.put((reading.timestamp, *reading.values))
+
+    #저장 대기 중인 개수 / 큐가 가득 차서 버린 개수
+    def pending(self):
+        return len(self.queue)
+
+    def dropped(self):
+        return self.queue.dropped
+
+    def _write_loop(self):
+        conn = self._connect()
+        sql = f'INSERT INTO readings (ts, {self.columns}) VALUES ({", ".join("?" * (len(CHANNELS) + 1))})'
+        last_compact = time.monotonic()
+        running = True
+        while running:
+            batch = []
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+                while True:
+                    if item is _STOP:
+                        running = False
+                        break
+                    batch.append(item)
+                    if len(batch) >= self.batch_size:
+                        break
+                    item = self.queue.get_nowait() #이미 쌓여있는 값은 기다리지 않고 같이 저장
+            except queue.Empty:
+                pass
+
+            if batch:
+                try:
+                    with conn: #with 블록 = 트랜잭션 1번 (성공하면 commit, 실패하면 rollback)
+                        conn.executemany(sql, batch)
+                except sqlite3.Error as e:
+                    print('❌ 센서 데이터 저장 오류:', str(e), file=sys.stderr)
+
+            #요약/정리도 같은 스레드에서 -> 수집 루프와 쓰기 연결을 건드리지 않음
+            if time.monotonic() - last_compact >= self.compact_interval:
+                last_compact = time.monotonic()
+                self._compact(conn)
+        conn.close()
+
+    #끝난 구간만 요약 -> 보관 기간이 지난 데이터 삭제
+    def _compact(self, conn, now=None):
+        now = time.time() if now is None else now
+        try:
+            with conn:
+                watermarks = dict(conn.execute('SELECT tier, watermark FROM rollup_state'))
+                for name, width, source in ROLLUP_TIERS:
+                    self._rollup(conn, watermarks, name, width, source, now)
+                self._apply_retention(conn, watermarks, now)
+        except sqlite3.Error as e:
+            print('❌ 센서 데이터 요약 오류:', str(e), file=sys.stderr)
+
+    def _rollup(self, conn, watermarks, name, width, source, now):
+        end = (now // width) * width #아직 진행 중인 구간은 제외
+        if source == 'raw':
+            table, time_col = 'readings', 'ts'
+            count_expr = 'COUNT(*)'
+            stat_exprs = [f'AVG("{key}"), MIN("{key}"), MAX("{key}")' for key in CHANNELS]
+        else:
+            if source not in watermarks: #아래 단계가 아직 요약되지 않음
+                return
+            end = min(end, watermarks[source])
+            table, time_col = f'rollup_{source}', 'bucket'
+            count_expr = 'SUM(count)'
+            #평균은 개수로 가중 평균
+            stat_exprs = [f'SUM("{key}_mean" * count) / SUM(count), MIN("{key}_min"), MAX("{key}_max")' for key in CHANNELS]
+
+        start = watermarks.get(name)
+        if start is None: #처음이면 가장 오래된 데이터가 들어있는 구간부터
+            first = conn.execute(f'SELECT MIN({time_col}) FROM {table}').fetchone()[0]
+            if first is None:
+                return
+            start = (first // width) * width
+        if start >= end:
+            return
+
+        conn.execute(
+            f'INSERT OR REPLACE INTO rollup_{name} '
+            f'SELECT CAST({time_col} / {width} AS INTEGER) * {width} AS b, {count_expr}, {", ".join(stat_exprs)} '
+            f'FROM {table} WHERE {time_col} >= ? AND {time_col} < ? GROUP BY b',
+            (start, end))
+        #watermark 이전 시각으로 늦게 들어온 원본 값은 요약에 반영되지 않음
+        conn.execute('INSERT OR REPLACE INTO rollup_state VALUES (?, ?)', (name, end))
+        watermarks[name] = end
+
+    def _apply_retention(self, conn, watermarks, now):
+        #각 단계를 요약하는 다음 단계 이름 (raw -> 1min -> 1hour -> 1day)
+        next_tier = {source: name for name, _, source in ROLLUP_TIERS}
+        for tier, keep in self.retention.items():
+            if keep is None:
+                continue
+            cutoff = now - keep
+            if tier in next_tier: #아직 다음 단계로 요약되지 않은 데이터는 남겨둠
+                cutoff = min(cutoff, watermarks.get(next_tier[tier], float('-inf')))
+            if tier == 'raw':
+                conn.execute('DELETE FROM readings WHERE ts < ?', (cutoff,))
+            else:
+                conn.execute(f'DELETE FROM rollup_{tier} WHERE bucket < ?', (cutoff,))
+
+    #요약/정리를 바로 실행 (테스트나 수동 정리용, 별도 연결 사용)
+    def compact(self, now=None):
+        conn = self._connect()
+        try:
+            self._compact(conn, now)
+        finally:
+            conn.close()
+
+    #start <= ts < end 기간의 측정값 (오래된 순서). end가 None이면 끝까지
+    def query(self, start=0.0, end=None):
+        conn = self._connect()
+        try:
+            if end is None:
+                rows = conn.execute(f'SELECT ts, {self.columns} FROM readings WHERE ts >= ? ORDER BY ts', (start,))
+            else:
+                rows = conn.execute(f'SELECT ts, {self.columns} FROM readings WHERE ts >= ? AND ts < ? ORDER BY ts', (start, end))
+            return [EnvReading(row[1:], timestamp=row[0]) for row in rows]
+        finally:
+            conn.close()
+
+    #가장 최근 n개 (오래된 순서)
+    def latest(self, n=1):
+        conn = self._connect()
+        try:
+            rows = conn.execute(f'SELECT ts, {self.columns} FROM readings ORDER BY ts DESC LIMIT ?', (n,)).fetchall()
+            return [EnvReading(row[1:], timestamp=row[0]) for row in reversed(rows)]
+        finally:
+            conn.close()
+
+    #요약 단계 데이터 조회 -> [{'bucket': ..., 'count': ..., '<키>_mean': ..., '<키>_min': ..., '<키>_max': ...}, ...]
+    def query_rollup(self, tier, start=0.0, end=None):
+        conn = self._connect()
+        try:
+            if end is None:
+                cursor = conn.execute(f'SELECT * FROM rollup_{tier} WHERE bucket >= ? ORDER BY bucket', (start,))
+            else:
+                cursor = conn.execute(f'SELECT * FROM rollup_{tier} WHERE bucket >= ? AND bucket < ? ORDER BY bucket', (start, end))
+            names = [column[0] for column in cursor.description]
+            return [dict(zip(names, row)) for row in cursor]
+        finally:
+            conn.close()
+
+    #대시보드용: 기간 길이에 맞춰 max_points 줄 이하가 되는 가장 촘촘한 단계를 골라서 조회
+    #반환값: (단계 이름, 데이터) / 'raw'이면 EnvReading 리스트, 아니면 query_rollup 결과
+    def query_range(self, start, end, max_points=3000):
+        if (end - start) / SAMPLE_INTERVAL <= max_points:
+            return 'raw', self.query(start, end)
+        for name, width, _ in ROLLUP_TIERS:
+            if (end - start) / width <= max_points:
+                return name, self.query_rollup(name, start, end)
+        name = ROLLUP_TIERS[-1][0]
+        return name, self.query_rollup(name, start, end)
+
+    #남은 값을 모두 저장하고 writer 스레드 종료
+    def close(self):
+        if self.writer.is_alive():
+            self.queue.put_wait(_STOP)
+            self.writer.join()
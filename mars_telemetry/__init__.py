@@ -0,0 +1,12 @@
+# mars_telemetry
+# 1-6 ~ 1-9 과제가 같이 쓰는 화성 기지 센서/텔레메트리 코드
+# - sensor.py       : DummySensor, 측정값 레코드(EnvReading), 채널 목록 (원본 1-6/mars_mission_computer.py를 불러옴)
+# - rolling_stats.py: 1분/5분/1시간 구간 이동 통계
+# - optional.py     : psutil/numpy처럼 없을 수도 있는 모듈을 처음 쓸 때 import
+# - history.py      : 기록된 측정값 파일(CSV/telemetry.db) 읽기 (csv/sqlite3를 쓰므로 필요한 곳에서 직접 import)
+# 폴더마다 있는 P06_mars_mission_computer.py, rolling_stats.py는 이 패키지를 다시 내보내는 연결 파일
+# (저장소 최상위 폴더를 sys.path에 넣는 일은 폴더마다 하나씩 있는 telemetry_path.py가 맡음)
+# import할 때 무거운 모듈을 불러오거나 센서를 만들지 않음
+
+from mars_telemetry.sensor import ENV_RANGES, CHANNELS, CHANNEL_INDEX, EnvReading, DummySensor, default_sensor
+from mars_telemetry.optional import load_optional
@@ -0,0 +1,32 @@
+# mars_telemetry/history.py
+# 기록된 측정값 파일(CSV 또는 1-9 TelemetryStore의 telemetry.db)을 한 줄씩 EnvReading으로 읽는 모듈
+# - 1-7 replay_backfill.py(구간 통계 다시 계산)와 1-9 sensor_sources.ReplaySource(재생)가 같이 사용
+# - 파일 전체를 메모리에 올리지 않음. 다 읽거나 generator를 close()하면 파일/DB 연결도 닫힘
+
+import csv
+import sqlite3
+
+from mars_telemetry.sensor import EnvReading, CHANNELS
+
+
+#CSV: timestamp + 센서 키 6개 열 (열 순서가 달라도 CHANNELS 순서로) / 그 외: TelemetryStore의 readings 테이블
+def iter_history(path):
+    if path.endswith('.csv'):
+        with open(path, newline='', encoding='utf-8') as f:
+            reader = csv.reader(f)
+            header = next(reader, None)
+            if header is None: #빈 파일
+                return
+            columns = [header.index(key) for key in CHANNELS]
+            time_column = header.index('timestamp')
+            for row in reader:
+                if row:
+                    yield EnvReading([float(row[i]) for i in columns], timestamp=float(row[time_column]))
+    else:
+        conn = sqlite3.connect(f'file:{path}?mode=ro', uri=True) #읽기 전용 (없는 파일을 새로 만들지 않음)
+        try:
+            columns = ', '.join(f'"{key}"' for key in CHANNELS)
+            for row in conn.execute(f'SELECT ts, {columns} FROM readings ORDER BY ts'):
+                yield EnvReading(row[1:], timestamp=row[0])
+        finally:
+            conn.close()
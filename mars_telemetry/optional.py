@@ -0,0 +1,21 @@
+# mars_telemetry/optional.py
+# 설치되어 있지 않을 수도 있는 무거운 모듈(psutil, numpy 등)을 처음 쓸 때 import
+# - 프로세스를 시작할 때마다 import하지 않음 -> 그 기능을 쓰지 않는 프로세스는 import 시간만큼 빨리 시작
+# - 한 번 import한 결과(모듈 또는 None)는 저장해뒀다가 그대로 반환
+# - 없을 때 warning을 주면 처음 한 번만 출력
+
+import sys
+import importlib
+
+_modules = {}
+
+
+def load_optional(name, warning=None):
+    if name not in _modules:
+        try:
+            _modules[name] = importlib.import_module(name)
+        except ImportError:
+            _modules[name] = None
+            if warning:
+                print(warning, file=sys.stderr) #측정값을 stdout으로 내보낼 때 섞이지 않도록
+    return _modules[name]
@@ -0,0 +1,150 @@
+# mars_telemetry/rolling_stats.py
+# 센서 값의 구간별(1분/5분/1시간) 이동 통계를 한 번에 계산하는 모듈
+# - 채널(센서 키)마다 가장 긴 구간 크기만큼의 링 버퍼 하나만 저장
+# - 구간마다 평균/분산은 Welford 방식(값 추가/제거), 최소/최대는 단조 deque로 갱신
+# - 값 하나가 들어올 때 구간 하나당 O(1) (deque는 amortized O(1))
+
+import math
+from array import array
+from collections import deque
+
+SAMPLE_INTERVAL = 5 #센서 값 수집 간격(초)
+
+#구간 이름: 구간 길이(초)
+STAT_WINDOWS = {
+    '1min': 60,
+    '5min': 300,
+    '1hour': 3600,
+}
+
+#센서 값 누적용 고정 크기 링 버퍼
+#리스트에 계속 append하면 메모리가 끝없이 늘어남 -> 크기가 정해진 array에 가장 오래된 값부터 덮어씀
+#합계를 같이 들고 있어서 평균은 매번 다시 더하지 않고 O(1)
+class RingBuffer:
+    def __init__(self, capacity):
+        self.capacity = capacity
+        self.data = array('d', [0.0] * capacity) #'d'는 float(8바이트) 배열
+        self.head = 0 #다음에 쓸 위치
+        self.size = 0 #현재 들어있는 값 개수
+        self.total = 0.0 #들어있는 값들의 합계
+
+    def append(self, value):
+        if self.size == self.capacity: #가득 차면 가장 오래된 값을 합계에서 빼고 덮어씀
+            self.total -= self.data[self.head]
+        else:
+            self.size += 1
+        self.data[self.head] = value
+        self.total += value
+        self.head = (self.head + 1) % self.capacity
+        if self.head == 0: #한 바퀴 돌 때마다 합계를 다시 계산해서 실수 오차가 쌓이지 않도록
+            self.total = math.fsum(self.data[:self.size])
+
+    #steps번 전에 넣은 값 (1이면 가장 최근 값)
+    def ago(self, steps):
+        return self.data[(self.head - steps) % self.capacity]
+
+    #가장 최근 n개 (오래된 값 -> 최근 값 순서)
+    def last(self, n):
+        return [self.ago(steps) for steps in range(n, 0, -1)]
+
+    def mean(self):
+        return self.total / self.size if self.size else None
+
+    def __len__(self):
+        return self.size
+
+
+#구간 하나의 이동 통계
+class RollingWindow:
+    def __init__(self, size):
+        self.size = size #구간에 들어가는 값 개수
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0 #편차 제곱합 (분산 = m2 / count)
+        self.min_deque = deque() #(번호, 값), 값이 커지는 순서 -> 맨 앞이 최솟값
+        self.max_deque = deque() #(번호, 값), 값이 작아지는 순서 -> 맨 앞이 최댓값
+
+    #index: 몇 번째 값인지 / evicted: 구간에서 빠지는 값 (구간이 아직 안 찼으면 None)
+    def push(self, index, value, evicted=None):
+        if evicted is None: #Welford 추가
+            self.count += 1
+            delta = value - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (value - self.mean)
+        else: #값 하나 추가 + 하나 제거를 한 번에 (개수는 그대로)
+            old_mean = self.mean
+            self.mean += (value - evicted) / self.size
+            self.m2 += (value - evicted) * (value - self.mean + evicted - old_mean)
+            if self.m2 < 0.0: #실수 오차로 음수가 되는 경우 방지
+                self.m2 = 0.0
+
+        #새 값보다 크거나 같은 값은 앞으로 최솟값이 될 일이 없으므로 제거 (최댓값은 반대)
+        while self.min_deque and self.min_deque[-1][1] >= value:
+            self.min_deque.pop()
+        self.min_deque.append((index, value))
+        while self.max_deque and self.max_deque[-1][1] <= value:
+            self.max_deque.pop()
+        self.max_deque.append((index, value))
+
+        #구간 밖으로 나간 값 제거
+        oldest = index - self.size
+        if self.min_deque[0][0] <= oldest:
+            self.min_deque.popleft()
+        if self.max_deque[0][0] <= oldest:
+            self.max_deque.popleft()
+
+    #누적된 실수 오차를 없애기 위해 구간 값 전체로 평균/편차 제곱합을 다시 계산
+    def resync(self, values):
+        self.mean = math.fsum(values) / len(values)
+        self.m2 = math.fsum((value - self.mean) ** 2 for value in values)
+
+    def stats(self):
+        if not self.count:
+            return {'mean': None, 'min': None, 'max': None, 'variance': None}
+        return {
+            'mean': self.mean,
+            'min': self.min_deque[0][1],
+            'max': self.max_deque[0][1],
+            'variance': self.m2 / self.count, #모분산
+        }
+
+
+#여러 채널 x 여러 구간 통계 엔진
+class RollingStats:
+    def __init__(self, keys, windows=STAT_WINDOWS, sample_interval=SAMPLE_INTERVAL):
+        #구간 길이(초) -> 값 개수 (5초 간격이면 1분 = 12개)
+        self.window_sizes = {name: max(1, int(seconds // sample_interval)) for name, seconds in windows.items()}
+        capacity = max(self.window_sizes.values())
+        self.index = 0 #지금까지 들어온 값 개수
+        self.history = {key: RingBuffer(capacity) for key in keys}
+        self.windows = {
+            key: {name: RollingWindow(size) for name, size in self.window_sizes.items()}
+            for key in keys
+        }
+
+    def update(self, env_values):
+        for key, ring in self.history.items():
+            value = env_values[key]
+            windows = self.windows[key]
+            #덮어쓰기 전에 구간마다 빠질 값을 먼저 꺼내둠
+            evicted = [ring.ago(window.size) if len(ring) >= window.size else None for window in windows.values()]
+            ring.append(value)
+            for window, old in zip(windows.values(), evicted):
+                window.push(self.index, value, old)
+                if old is not None and self.index % window.size == 0: #구간 크기만큼 들어올 때마다 한 번 (amortized O(1))
+                    window.resync(ring.last(window.size))
+        self.index += 1
+
+    #{구간 이름: {센서 키: {mean, min, max, variance}}}
+    def snapshot(self, digits=3):
+        result = {}
+        for name in self.window_sizes:
+            result[name] = {}
+            for key, windows in self.windows.items():
+                stats = windows[name].stats()
+                result[name][key] = {
+                    #분산은 단위가 제곱이라 자리수도 두 배 (co2처럼 작은 값이 0.0으로 보이지 않도록)
+                    stat: round(value, digits * 2 if stat == 'variance' else digits) if value is not None else None
+                    for stat, value in stats.items()
+                }
+        return result
@@ -0,0 +1,30 @@
+# mars_telemetry/sensor.py
+# 1-6 과제의 DummySensor와 측정값 레코드(EnvReading)
+# 원본은 1-6/mars_mission_computer.py 한 곳에만 있고, 여기서는 그 파일을 불러와서 다시 내보냄
+# (폴더 이름 '1-6'은 패키지 이름으로 쓸 수 없고, 폴더마다 mars_mission_computer.py가 있어서 이름이 겹치므로 파일 경로로 불러옴)
+
+import os
+import sys
+import importlib.util
+
+SOURCE = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), '1-6', 'mars_mission_computer.py')
+MODULE_NAME = 'mars_telemetry._dummy_sensor'
+
+
+def _load_source():
+    module = sys.modules.get(MODULE_NAME)
+    if module is None:
+        spec = importlib.util.spec_from_file_location(MODULE_NAME, SOURCE)
+        module = importlib.util.module_from_spec(spec)
+        sys.modules[MODULE_NAME] = module #spawn으로 시작한 프로세스에서 EnvReading을 pickle할 때도 같은 모듈을 찾도록
+        spec.loader.exec_module(module)
+    return module
+
+
+_source = _load_source()
+ENV_RANGES = _source.ENV_RANGES
+CHANNELS = _source.CHANNELS
+CHANNEL_INDEX = _source.CHANNEL_INDEX
+EnvReading = _source.EnvReading
+DummySensor = _source.DummySensor
+default_sensor = _source.default_sensor